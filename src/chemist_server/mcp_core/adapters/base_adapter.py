@@ -1,12 +1,31 @@
 """Base adapter interface for MCP tools."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
 
 class BaseAdapter(ABC):
     """Base class for tool adapters."""
 
+    async def __aenter__(self) -> Self:
+        """Initialize the adapter on context entry.
+
+        Returns:
+            Self: The initialized adapter
+        """
+        await self.initialize()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Shut the adapter down on context exit, releasing pooled resources."""
+        await self.shutdown()
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initialize the adapter.
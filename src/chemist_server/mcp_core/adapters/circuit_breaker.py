@@ -1,6 +1,7 @@
 """Circuit breaker pattern for MCP tool adapters."""
 
-import asyncio
+import inspect
+import random
 import time
 from collections.abc import Callable
 from enum import Enum
@@ -29,24 +30,32 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
         half_open_max_calls: int = 1,
+        recovery_jitter: float = 0.0,
     ) -> None:
         """Initialize circuit breaker.
 
         Args:
             name: Circuit breaker name
             failure_threshold: Number of failures before opening
-            recovery_timeout: Seconds to wait before trying recovery
+            recovery_timeout: Minimum seconds to wait before trying recovery
             half_open_max_calls: Max calls allowed in half-open state
+            recovery_jitter: Up to this fraction of recovery_timeout is added
+                at random each time the circuit opens (0 disables jitter)
         """
         self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_max_calls = half_open_max_calls
+        self.recovery_jitter = recovery_jitter
 
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.last_failure_time = 0.0
+        # Monotonic twin of last_failure_time, immune to wall-clock jumps
+        self._last_failure_mono = 0.0
         self.half_open_calls = 0
+        # Actual wait before the next recovery attempt, re-drawn on every open
+        self._recovery_delay = recovery_timeout
 
         logger.info(
             f"Circuit breaker {name} initialized",
@@ -70,10 +79,11 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open or function fails
         """
         if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.recovery_timeout:
+            if time.monotonic() - self._last_failure_mono > self._recovery_delay:
                 # Try recovery
                 logger.info(
-                    f"Circuit {self.name} attempting recovery",
+                    "Circuit %s attempting recovery",
+                    self.name,
                     circuit=self.name,
                     prev_state=self.state.value,
                     new_state=CircuitState.HALF_OPEN.value,
@@ -87,8 +97,8 @@ class CircuitBreaker:
                     details={
                         "circuit": self.name,
                         "state": self.state.value,
-                        "retry_after": self.recovery_timeout
-                        - (time.time() - self.last_failure_time),
+                        "retry_after": self._recovery_delay
+                        - (time.monotonic() - self._last_failure_mono),
                     },
                 )
 
@@ -111,30 +121,34 @@ class CircuitBreaker:
             self.half_open_calls += 1
 
         try:
-            # Execute the function
-            result = (
-                await func(*args, **kwargs)
-                if asyncio.iscoroutinefunction(func)
-                else func(*args, **kwargs)
-            )
+            # Execute the function, awaiting whatever awaitable it returns so
+            # callers always receive the final value
+            result = func(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
 
             # Success handling
             if self.state == CircuitState.HALF_OPEN:
                 # Recovery successful
                 logger.info(
-                    f"Circuit {self.name} recovered",
+                    "Circuit %s recovered",
+                    self.name,
                     circuit=self.name,
                     prev_state=self.state.value,
                     new_state=CircuitState.CLOSED.value,
                 )
                 self.state = CircuitState.CLOSED
                 self.failure_count = 0
+            elif self.failure_count:
+                # Only consecutive failures count towards the threshold
+                self.failure_count = 0
 
             return cast(T, result)
         except Exception as e:
             # Failure handling
             self.failure_count += 1
             self.last_failure_time = time.time()
+            self._last_failure_mono = time.monotonic()
 
             if self.state == CircuitState.HALF_OPEN or (
                 self.state == CircuitState.CLOSED
@@ -143,13 +157,20 @@ class CircuitBreaker:
                 # Open the circuit
                 prev_state = self.state
                 self.state = CircuitState.OPEN
+                # Jitter the recovery window upwards so breakers tripped by the
+                # same outage do not all probe at once, while recovery_timeout
+                # remains the minimum wait
+                self._recovery_delay = self.recovery_timeout * (
+                    1.0 + self.recovery_jitter * random.random()
+                )
                 logger.warning(
-                    f"Circuit {self.name} opened",
+                    "Circuit %s opened",
+                    self.name,
                     circuit=self.name,
                     prev_state=prev_state.value,
                     new_state=self.state.value,
                     failures=self.failure_count,
-                    recovery_timeout=self.recovery_timeout,
+                    recovery_timeout=self._recovery_delay,
                 )
 
             # Re-raise the exception
@@ -168,7 +189,9 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.failure_count = 0
         self.last_failure_time = 0.0
+        self._last_failure_mono = 0.0
         self.half_open_calls = 0
+        self._recovery_delay = self.recovery_timeout
 
         logger.info(
             f"Circuit {self.name} reset", circuit=self.name, state=self.state.value
@@ -1,9 +1,15 @@
 """Python adapter for MCP tools."""
 
 import asyncio
+import contextlib
+import functools
+import hashlib
 import importlib
 import inspect
-from concurrent.futures import ThreadPoolExecutor
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from ..errors import AdapterError
@@ -15,7 +21,15 @@ class PythonAdapter(BaseAdapter):
     """Adapter for Python-based tools."""
 
     def __init__(
-        self, module_path: str, function_name: str, load_module: bool = True
+        self,
+        module_path: str,
+        function_name: str,
+        load_module: bool = True,
+        max_workers: int | None = None,
+        health_ttl: float = 2.0,
+        unhealthy_health_ttl: float = 30.0,
+        max_concurrency: int = 32,
+        timeout: float | None = None,
     ) -> None:
         """Initialize Python adapter.
 
@@ -23,11 +37,33 @@ class PythonAdapter(BaseAdapter):
             module_path: Import path to the Python module
             function_name: Name of the function to execute
             load_module: Whether to load the module immediately
+            max_workers: Size of the worker pool used for synchronous functions
+                (defaults to the ThreadPoolExecutor default)
+            health_ttl: Seconds a healthy health_check result is reused
+            unhealthy_health_ttl: Seconds an unhealthy result is reused before
+                the module import is retried
+            max_concurrency: Maximum number of in-flight executions; further
+                callers wait for a free slot
+            timeout: Default end-to-end deadline in seconds for execute(),
+                including time spent waiting for a slot (None disables it)
         """
         self.module_path = module_path
         self.function_name = function_name
         self.module = None
         self.function = None
+        self.max_workers = max_workers
+        # Created on first synchronous call and reused until shutdown()
+        self._executor: ThreadPoolExecutor | None = None
+        self.health_ttl = health_ttl
+        self.unhealthy_health_ttl = unhealthy_health_ttl
+        # (expires_at, result) on the monotonic clock
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        # Bulkhead bounding in-flight executions on this adapter
+        self.max_concurrency = max_concurrency
+        self._bulkhead = asyncio.Semaphore(max_concurrency)
+        self.timeout = timeout
+        # Single-flight map of coalesced executions still in progress
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
 
         if load_module:
             try:
@@ -35,7 +71,7 @@ class PythonAdapter(BaseAdapter):
             except Exception as e:
                 logger.error(
                     f"Failed to load module {module_path}",
-                    module=module_path,
+                    module_path=module_path,
                     error=str(e),
                 )
 
@@ -54,9 +90,12 @@ class PythonAdapter(BaseAdapter):
                     f"Function {self.function_name} not found in module {self.module_path}"
                 )
 
+            # A successful load supersedes any cached unhealthy result
+            self._health_cache = None
+
             logger.info(
                 f"Loaded module {self.module_path} function {self.function_name}",
-                module=self.module_path,
+                module_path=self.module_path,
                 function=self.function_name,
             )
         except ImportError as e:
@@ -68,6 +107,19 @@ class PythonAdapter(BaseAdapter):
                 f"Failed to get function {self.function_name} from module {self.module_path}: {e!s}"
             ) from e
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the adapter's worker pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Executor shared by all calls on this adapter
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"py-adapter-{self.function_name}",
+            )
+        return self._executor
+
     async def execute(
         self,
         tool_name: str,
@@ -76,6 +128,19 @@ class PythonAdapter(BaseAdapter):
     ) -> dict[str, Any]:
         """Execute the Python function.
 
+        The call is bounded by an end-to-end deadline taken from
+        ``context["deadline_s"]`` when present, otherwise from the adapter's
+        ``timeout``. Synchronous functions already running in the worker pool
+        cannot be interrupted; the caller stops waiting for them, but their
+        bulkhead slot stays taken until the worker finishes, so at most
+        ``max_concurrency`` functions ever run at once.
+
+        When ``context["coalesce"]`` is true, concurrent calls with the same
+        tool name, parameters and deadline share a single execution and each
+        receives its own copy of the result dict. Only set it for idempotent
+        tools. Parameters that cannot be serialised canonically are executed
+        without coalescing.
+
         Args:
             tool_name: Name of the tool to execute
             parameters: Tool parameters
@@ -87,12 +152,64 @@ class PythonAdapter(BaseAdapter):
         Raises:
             AdapterError: If execution fails
         """
+        if not (context and context.get("coalesce")):
+            return await self._execute(tool_name, parameters, context)
+
+        deadline = context.get("deadline_s", self.timeout)
+        try:
+            key = self._coalesce_key(tool_name, parameters, deadline)
+        except (TypeError, ValueError):
+            # e.g. arbitrary objects, or dicts mixing str and int keys
+            return await self._execute(tool_name, parameters, context)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(tool_name, parameters, context))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the shared execution
+        result = await asyncio.shield(task)
+        # Copy so one caller mutating its result does not affect the others
+        return dict(result)
+
+    @staticmethod
+    def _coalesce_key(
+        tool_name: str, parameters: dict[str, Any], deadline: float | None
+    ) -> str:
+        """Build the single-flight key for a call.
+
+        Args:
+            tool_name: Name of the tool
+            parameters: Tool parameters
+            deadline: Effective deadline of the call in seconds
+
+        Returns:
+            str: Key identifying identical calls
+
+        Raises:
+            TypeError: If the parameters cannot be serialised canonically
+        """
+        # No default= fallback: objects json cannot encode have no reliable
+        # identity (reprs can collide), so such calls are not coalesced
+        payload = json.dumps([deadline, parameters], sort_keys=True).encode()
+        return f"{tool_name}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+    async def _execute(
+        self,
+        tool_name: str,
+        parameters: dict[str, Any],
+        context: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Run the function once under the deadline and bulkhead."""
         if self.function is None:
             try:
                 self._load_module()
             except Exception as e:
                 raise AdapterError(f"Failed to load module: {e!s}") from e
 
+        deadline = (context or {}).get("deadline_s", self.timeout)
+        deadline_scope = asyncio.timeout(deadline)
+
         try:
             # Check if the function is async
             if self.function is None:
@@ -100,56 +217,126 @@ class PythonAdapter(BaseAdapter):
                     "Function not initialized. Call _load_module() first."
                 )
 
-            if inspect.iscoroutinefunction(self.function):
-                result = await self.function(**parameters)
-            else:
-                # Run in executor if not async
-                loop = asyncio.get_event_loop()
-                func = self.function  # Store reference to avoid None check issues
-                result = await loop.run_in_executor(
-                    ThreadPoolExecutor(), func, **parameters
+            if self._bulkhead.locked():
+                logger.debug(
+                    "Adapter for %s at capacity, waiting for a slot",
+                    tool_name,
+                    tool=tool_name,
+                    max_concurrency=self.max_concurrency,
                 )
 
+            async with deadline_scope:
+                result = await self._call_in_slot(self.function, parameters)
+
             # Ensure result is a dict
             if not isinstance(result, dict):
                 result = {"result": result}
 
             return result
+        except TimeoutError as e:
+            if not deadline_scope.expired():
+                raise AdapterError(f"Error executing {tool_name}: {e!s}") from e
+            logger.warning(
+                "Deadline exceeded executing %s",
+                tool_name,
+                tool=tool_name,
+                deadline_s=deadline,
+            )
+            raise AdapterError(
+                f"Deadline of {deadline}s exceeded executing {tool_name}",
+                details={"tool": tool_name, "deadline_s": deadline},
+            ) from e
         except Exception as e:
             logger.error(
-                f"Error executing {tool_name}",
+                "Error executing %s",
+                tool_name,
                 tool=tool_name,
                 function=self.function_name,
                 error=str(e),
             )
             raise AdapterError(f"Error executing {tool_name}: {e!s}") from e
 
-    async def health_check(self) -> dict[str, Any]:
+    async def _call_in_slot(
+        self, func: Callable[..., Any], parameters: dict[str, Any]
+    ) -> Any:
+        """Call the function while holding a bulkhead slot.
+
+        Synchronous functions run in the adapter's persistent executor. A
+        worker keeps running after its caller gives up, so the slot is only
+        released once the executor future completes.
+
+        Args:
+            func: Function to call
+            parameters: Keyword arguments for the function
+
+        Returns:
+            Any: Raw function result
+        """
+        await self._bulkhead.acquire()
+        if inspect.iscoroutinefunction(func):
+            try:
+                return await func(**parameters)
+            finally:
+                self._bulkhead.release()
+
+        loop = asyncio.get_running_loop()
+
+        def release_slot(_: Future[Any]) -> None:
+            # Loop already closed means nothing is left waiting for the slot
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._bulkhead.release)
+
+        try:
+            future = self._get_executor().submit(functools.partial(func, **parameters))
+        except BaseException:
+            self._bulkhead.release()
+            raise
+        future.add_done_callback(release_slot)
+        return await asyncio.wrap_future(future)
+
+    async def health_check(self, use_cache: bool = True) -> dict[str, Any]:
         """Check adapter health.
 
+        Results are reused for health_ttl seconds when healthy and
+        unhealthy_health_ttl seconds when unhealthy, so frequent probes do not
+        retry a failing module import on every call.
+
+        Args:
+            use_cache: Whether a cached result may be returned
+
         Returns:
             Dict[str, Any]: Health check result
 
         Raises:
             AdapterError: If health check fails
         """
+        now = time.monotonic()
+        if use_cache and self._health_cache and now < self._health_cache[0]:
+            return dict(self._health_cache[1])
+
         try:
             if self.module is None:
                 self._load_module()
 
-            return {
+            result = {
                 "status": "healthy",
                 "module": self.module_path,
                 "function": self.function_name,
                 "loaded": self.module is not None and self.function is not None,
             }
+            ttl = self.health_ttl
         except Exception as e:
-            return {
+            result = {
                 "status": "unhealthy",
                 "module": self.module_path,
                 "function": self.function_name,
                 "error": str(e),
             }
+            ttl = self.unhealthy_health_ttl
+
+        self._health_cache = (now + ttl, result)
+        # Callers get a copy so they cannot alter the cached entry
+        return dict(result)
 
     async def initialize(self) -> None:
         """Initialize the adapter.
@@ -169,5 +356,7 @@ class PythonAdapter(BaseAdapter):
         Raises:
             AdapterError: If shutdown fails
         """
-        # Nothing to do for Python adapter
-        pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._health_cache = None
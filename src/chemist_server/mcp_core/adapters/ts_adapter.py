@@ -121,7 +121,8 @@ class TypeScriptAdapter(BaseAdapter):
             return result
         except Exception as e:
             logger.error(
-                f"Error executing TypeScript tool {tool_name}",
+                "Error executing TypeScript tool %s",
+                tool_name,
                 tool=tool_name,
                 error=str(e),
             )
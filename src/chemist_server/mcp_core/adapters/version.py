@@ -1,8 +1,11 @@
 """Version control for tool adapters."""
 
+import re
+from collections.abc import Callable
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..errors import AdapterError
 
@@ -15,6 +18,27 @@ class VersionStrategy(str, Enum):
     INCREMENT = "increment"  # Simple incremental versioning (e.g., 1, 2, 3)
 
 
+_VALID_STRATEGIES = frozenset(s.value for s in VersionStrategy)
+
+# strategy -> (compiled format, human-readable format for error messages)
+_VERSION_PATTERNS: dict[VersionStrategy, tuple[re.Pattern[str], str]] = {
+    VersionStrategy.SEMANTIC: (
+        re.compile(r"[0-9]+\.[0-9]+\.[0-9]+"),
+        "in format x.y.z",
+    ),
+    VersionStrategy.DATE: (re.compile(r"[0-9]{8}"), "in format YYYYMMDD"),
+    VersionStrategy.INCREMENT: (re.compile(r"[0-9]+"), "a number"),
+}
+
+# strategy -> ordering key for a validated version string. Date versions
+# (YYYYMMDD) order correctly as strings.
+_VERSION_KEY_FUNCS: dict[VersionStrategy, Callable[[str], Any]] = {
+    VersionStrategy.SEMANTIC: lambda v: tuple(map(int, v.split("."))),
+    VersionStrategy.DATE: str,
+    VersionStrategy.INCREMENT: int,
+}
+
+
 class VersionInfo(BaseModel):
     """Version information for a tool."""
 
@@ -23,8 +47,8 @@ class VersionInfo(BaseModel):
     is_latest: bool = False
     is_deprecated: bool = False
     min_core_version: str | None = None
-    changes: list[str] = []
-    metadata: dict[str, str] = {}
+    changes: list[str] = Field(default_factory=list)
+    metadata: dict[str, str] = Field(default_factory=dict)
 
 
 class VersionManager:
@@ -39,14 +63,21 @@ class VersionManager:
             strategy: Versioning strategy to use
         """
         if isinstance(strategy, str):
-            try:
-                self.strategy = VersionStrategy(strategy)
-            except ValueError as err:
-                raise AdapterError(f"Invalid version strategy: {strategy}") from err
+            if strategy not in _VALID_STRATEGIES:
+                raise AdapterError(f"Invalid version strategy: {strategy}")
+            self.strategy = VersionStrategy(strategy)
         else:
             self.strategy = strategy
 
+        # The strategy is fixed for the manager's lifetime; resolve it once
+        self._version_pattern, self._version_format = _VERSION_PATTERNS[self.strategy]
+        self._sort_key = _VERSION_KEY_FUNCS[self.strategy]
+
         self.versions: dict[str, dict[str, VersionInfo]] = {}
+        # tool_name -> (sort key, version) of the highest registered version
+        self._highest: dict[str, tuple[Any, str]] = {}
+        # tool_name -> version most recently registered with is_latest=True
+        self._marked_latest: dict[str, str] = {}
 
     def register_version(self, tool_name: str, version_info: VersionInfo) -> None:
         """Register a version for a tool.
@@ -67,14 +98,26 @@ class VersionManager:
             )
 
         # Validate according to strategy
-        self._validate_version(version_info.version)
+        version = version_info.version
+        self._validate_version(version)
 
-        # If this is marked as latest, unmark any other latest versions
+        # If this is marked as latest, unmark the previously marked version
         if version_info.is_latest:
-            for other_version in self.versions[tool_name].values():
-                other_version.is_latest = False
+            previous = self._marked_latest.get(tool_name)
+            if previous is not None:
+                tool_versions = self.versions[tool_name]
+                tool_versions[previous] = tool_versions[previous].model_copy(
+                    update={"is_latest": False}
+                )
+            self._marked_latest[tool_name] = version
+
+        # Keep the highest version up to date so lookups never re-sort
+        key = self._sort_key(version)
+        highest = self._highest.get(tool_name)
+        if highest is None or key > highest[0]:
+            self._highest[tool_name] = (key, version)
 
-        self.versions[tool_name][version_info.version] = version_info
+        self.versions[tool_name][version] = version_info
 
     def get_latest_version(self, tool_name: str) -> str:
         """Get the latest version for a tool.
@@ -88,27 +131,17 @@ class VersionManager:
         Raises:
             AdapterError: If tool has no registered versions
         """
-        if tool_name not in self.versions or not self.versions[tool_name]:
+        highest = self._highest.get(tool_name)
+        if highest is None:
             raise AdapterError(f"No versions registered for tool {tool_name}")
 
         # First check for explicitly marked latest
-        for version, info in self.versions[tool_name].items():
-            if info.is_latest:
-                return version
-
-        # Otherwise use strategy-specific logic
-        if self.strategy == VersionStrategy.SEMANTIC:
-            return max(
-                self.versions[tool_name].keys(),
-                key=lambda v: [int(x) for x in v.split(".")],
-            )
-        elif self.strategy == VersionStrategy.DATE:
-            return max(self.versions[tool_name].keys())
-        elif self.strategy == VersionStrategy.INCREMENT:
-            return max(self.versions[tool_name].keys(), key=lambda v: int(v))
+        marked = self._marked_latest.get(tool_name)
+        if marked is not None and self.versions[tool_name][marked].is_latest:
+            return marked
 
-        # Fallback
-        return max(self.versions[tool_name].keys())
+        # Otherwise the highest version according to the strategy
+        return highest[1]
 
     def get_version_info(self, tool_name: str, version: str) -> VersionInfo:
         """Get version info for a tool.
@@ -164,7 +197,10 @@ class VersionManager:
         if version not in self.versions[tool_name]:
             raise AdapterError(f"Version {version} not found for tool {tool_name}")
 
-        self.versions[tool_name][version].is_deprecated = True
+        tool_versions = self.versions[tool_name]
+        tool_versions[version] = tool_versions[version].model_copy(
+            update={"is_deprecated": True}
+        )
 
     def _validate_version(self, version: str) -> None:
         """Validate a version string according to the strategy.
@@ -175,22 +211,8 @@ class VersionManager:
         Raises:
             AdapterError: If version is invalid
         """
-        if self.strategy == VersionStrategy.SEMANTIC:
-            # Basic semantic version validation (x.y.z)
-            parts = version.split(".")
-            if len(parts) != 3 or not all(p.isdigit() for p in parts):
-                raise AdapterError(
-                    f"Invalid semantic version: {version}. Must be in format x.y.z"
-                )
-        elif self.strategy == VersionStrategy.DATE:
-            # Basic date validation (YYYYMMDD)
-            if len(version) != 8 or not version.isdigit():
-                raise AdapterError(
-                    f"Invalid date version: {version}. Must be in format YYYYMMDD"
-                )
-        elif self.strategy == VersionStrategy.INCREMENT:
-            # Simple integer validation
-            if not version.isdigit():
-                raise AdapterError(
-                    f"Invalid increment version: {version}. Must be a number"
-                )
+        if not self._version_pattern.fullmatch(version):
+            raise AdapterError(
+                f"Invalid {self.strategy.value} version: {version}. "
+                f"Must be {self._version_format}"
+            )
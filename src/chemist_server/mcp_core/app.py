@@ -115,25 +115,12 @@ def get_fastmcp_app(config: AppConfig) -> FastMCP:
         Returns:
             Command execution results
         """
-        logger.info(
+        logger.debug(
             "Executing run_command tool",
             command=command,
             request_id=ctx.request_id,
         )
-        try:
-            result = await run_command(ctx=None, command=command)
-            logger.info(
-                "Command executed successfully",
-                request_id=ctx.request_id,
-            )
-            return result
-        except Exception as e:
-            logger.error(
-                f"Error executing command: {e}",
-                request_id=ctx.request_id,
-                exc_info=True,
-            )
-            raise
+        return await run_command(ctx=None, command=command)
 
     @app.tool(
         name="show_security_rules",
@@ -150,20 +137,11 @@ def get_fastmcp_app(config: AppConfig) -> FastMCP:
         Returns:
             Security rules configuration
         """
-        logger.info(
+        logger.debug(
             "Executing show_security_rules tool",
             request_id=ctx.request_id,
         )
-        try:
-            result = await show_security_rules(ctx=None)
-            return result
-        except Exception as e:
-            logger.error(
-                f"Error showing security rules: {e}",
-                request_id=ctx.request_id,
-                exc_info=True,
-            )
-            raise
+        return await show_security_rules(ctx=None)
 
     @app.tool(name="git_status", description="Get the Git status of a repository")
     async def git_status_wrapper(
@@ -177,20 +155,11 @@ def get_fastmcp_app(config: AppConfig) -> FastMCP:
         Returns:
             Git status information
         """
-        logger.info(
+        logger.debug(
             "Executing git_status tool",
             request_id=ctx.request_id,
         )
-        try:
-            result = await get_git_status()
-            return result
-        except Exception as e:
-            logger.error(
-                f"Error getting git status: {e}",
-                request_id=ctx.request_id,
-                exc_info=True,
-            )
-            raise
+        return await get_git_status()
 
     @app.tool(name="git_branches", description="List branches in a Git repository")
     async def git_branches_wrapper(
@@ -204,20 +173,11 @@ def get_fastmcp_app(config: AppConfig) -> FastMCP:
         Returns:
             List of branches
         """
-        logger.info(
+        logger.debug(
             "Executing git_branches tool",
             request_id=ctx.request_id,
         )
-        try:
-            result = await list_branches()
-            return result
-        except Exception as e:
-            logger.error(
-                f"Error listing git branches: {e}",
-                request_id=ctx.request_id,
-                exc_info=True,
-            )
-            raise
+        return await list_branches()
 
     @app.tool(name="search_code", description="Search for patterns in the codebase")
     async def search_code_wrapper(
@@ -235,27 +195,17 @@ def get_fastmcp_app(config: AppConfig) -> FastMCP:
         Returns:
             Search results
         """
-        logger.info(
+        logger.debug(
             "Executing search_code tool",
             query=query,
             file_patterns=file_patterns,
             request_id=ctx.request_id,
         )
-        try:
-            result = await search_codebase(query=query, file_patterns=file_patterns)
-            return result
-        except Exception as e:
-            logger.error(
-                f"Error searching code: {e}",
-                request_id=ctx.request_id,
-                exc_info=True,
-            )
-            raise
+        return await search_codebase(query=query, file_patterns=file_patterns)
 
     # Core Tool Example
     @app.tool(name="core_add")
     def core_add_tool(a: int, b: int) -> int:
-        logger.info(f"Executing core_add tool with a={a}, b={b}")
         return a + b
 
     # Health Check Tool
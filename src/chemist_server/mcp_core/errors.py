@@ -1,107 +1,93 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+# Shared read-only details for errors raised without any
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+
 class MCPError(Exception):
-    """Base error for MCP system."""
+    """Base error for MCP system.
+
+    Subclasses only set ``CODE``; construction is handled here.
+    """
+
+    # Attributes live in slots so instances need no per-error __dict__
+    __slots__ = ("_details", "code", "message")
+
+    CODE: ClassVar[str] = "MCP_ERROR"
 
-    def __init__(self, code: str, message: str, details: dict | None = None) -> None:
+    def __init__(
+        self, message: str, details: dict | None = None, code: str | None = None
+    ) -> None:
         """Initialize base MCP error.
 
         Args:
-            code: Error code identifier
             message: Human-readable error message
             details: Additional error details dictionary
+            code: Error code identifier, defaults to the class CODE
         """
-        self.code = code
+        self.code = code or type(self).CODE
         self.message = message
-        self.details = details or {}
+        # Kept as None when absent so raising allocates no dict; the
+        # property hands out a shared empty mapping instead
+        self._details = details
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException only pickles args and __dict__; carry the slots too
+        return (type(self), (self.message, self._details, self.code), self.__dict__)
+
+    @property
+    def details(self) -> Mapping[str, Any]:
+        """Additional error details (read-only and empty when none were given)."""
+        return self._details if self._details is not None else _NO_DETAILS
+
 
 class ConfigurationError(MCPError):
     """Configuration-related errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize configuration error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__("CONFIG_ERROR", message, details)
+    __slots__ = ()
+    CODE = "CONFIG_ERROR"
 
 
 class TransportError(MCPError):
     """Transport layer errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize transport error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__("TRANSPORT_ERROR", message, details)
+    __slots__ = ()
+    CODE = "TRANSPORT_ERROR"
 
 
 class ToolError(MCPError):
     """Tool-related errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize tool error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__("TOOL_ERROR", message, details)
+    __slots__ = ()
+    CODE = "TOOL_ERROR"
 
 
 class AdapterError(MCPError):
     """Adapter-related errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize adapter error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__("ADAPTER_ERROR", message, details)
+    __slots__ = ()
+    CODE = "ADAPTER_ERROR"
 
 
 class CircuitBreakerError(AdapterError):
     """Circuit breaker related errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize circuit breaker error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__(message, details)
-        self.code = "CIRCUIT_BREAKER_ERROR"
+    __slots__ = ()
+    CODE = "CIRCUIT_BREAKER_ERROR"
 
 
 class ValidationError(MCPError):
     """Validation-related errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize validation error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__("VALIDATION_ERROR", message, details)
+    __slots__ = ()
+    CODE = "VALIDATION_ERROR"
 
 
 class AuthenticationError(MCPError):
     """Authentication-related errors."""
 
-    def __init__(self, message: str, details: dict | None = None) -> None:
-        """Initialize authentication error.
-
-        Args:
-            message: Human-readable error message
-            details: Additional error details dictionary
-        """
-        super().__init__("AUTH_ERROR", message, details)
+    __slots__ = ()
+    CODE = "AUTH_ERROR"
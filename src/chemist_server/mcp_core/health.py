@@ -1,3 +1,5 @@
+import asyncio
+import copy
 import time
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -13,6 +15,12 @@ class HealthStatus(Enum):
     UNHEALTHY = "unhealthy"
 
 
+# Ordered worst-last so aggregation is a max() over severities
+_BY_SEVERITY = (HealthStatus.HEALTHY, HealthStatus.DEGRADED, HealthStatus.UNHEALTHY)
+_SEVERITY = {status: rank for rank, status in enumerate(_BY_SEVERITY)}
+_UNHEALTHY_SEVERITY = _SEVERITY[HealthStatus.UNHEALTHY]
+
+
 class HealthCheck(ABC):
     """Base health check interface."""
 
@@ -25,49 +33,120 @@ class HealthCheck(ABC):
 class SystemHealth(HealthCheck):
     """System-wide health monitoring."""
 
-    def __init__(self, components: list[HealthCheck]) -> None:
+    def __init__(
+        self,
+        components: list[HealthCheck],
+        max_concurrent: int = 20,
+        cache_ttl: float = 1.0,
+    ) -> None:
         """Initialize the system health checker.
 
         Args:
             components: List of health check components
+            max_concurrent: Maximum number of component checks in flight at once
+            cache_ttl: Seconds an aggregated result is reused (0 disables caching)
         """
         self.components = components
         self.start_time = time.time()
+        self.max_concurrent = max_concurrent
+        self.cache_ttl = cache_ttl
+        # Shared across calls so overlapping probes cannot exceed the bound
+        self._check_slots = asyncio.Semaphore(max_concurrent)
+        # (monotonic timestamp, result) of the last aggregated check
+        self._health_cache: tuple[float, dict] | None = None
+        # Refresh currently running, shared by concurrent callers
+        self._inflight: asyncio.Task[dict] | None = None
+
+    async def _bounded_check(self, component: HealthCheck) -> dict:
+        """Run one component check while holding a concurrency slot."""
+        async with self._check_slots:
+            return await component.check_health()
+
+    async def check_health(self, use_cache: bool = True) -> dict:
+        """Check health of all components.
+
+        Results are reused for cache_ttl seconds, and callers arriving while
+        a refresh is running await that refresh instead of starting another.
+        Every caller receives its own copy of the report.
 
-    async def check_health(self) -> dict:
-        """Check health of all components."""
-        status = HealthStatus.HEALTHY
+        Args:
+            use_cache: Whether a recent cached result may be returned
+
+        Returns:
+            dict: Aggregated status, uptime and per-component results
+        """
+        if not use_cache:
+            return await self._check_components()
+
+        cached = self._fresh_cached_result()
+        if cached is not None:
+            return cached
+
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._check_components())
+            self._inflight.add_done_callback(self._clear_inflight)
+        # Shield so one cancelled caller does not cancel the shared refresh
+        result = await asyncio.shield(self._inflight)
+        # Each caller gets its own copy of the shared report
+        return copy.deepcopy(result)
+
+    def _clear_inflight(self, task: asyncio.Task[dict]) -> None:
+        """Forget a finished refresh so the next caller can start a new one."""
+        if self._inflight is task:
+            self._inflight = None
+
+    def _fresh_cached_result(self) -> dict | None:
+        """Return the cached result with a current uptime, if still fresh."""
+        if self._health_cache is None:
+            return None
+        checked_at, result = self._health_cache
+        if time.monotonic() - checked_at >= self.cache_ttl:
+            return None
+        # Deep copy so callers cannot alter the cached components
+        report = copy.deepcopy(result)
+        report["uptime"] = time.time() - self.start_time
+        return report
+
+    async def _check_components(self) -> dict:
+        """Probe every component and cache the aggregated result."""
+        worst = 0
         results = {}
 
-        for component in self.components:
-            try:
-                component_health = await component.check_health()
-                results[component.__class__.__name__] = component_health
-
-                if component_health["status"] == HealthStatus.UNHEALTHY:
-                    status = HealthStatus.UNHEALTHY
-                elif (
-                    component_health["status"] == HealthStatus.DEGRADED
-                    and status != HealthStatus.UNHEALTHY
-                ):
-                    status = HealthStatus.DEGRADED
-            except Exception as e:
+        # Components are independent, so probe them concurrently (bounded)
+        outcomes = await asyncio.gather(
+            *map(self._bounded_check, self.components),
+            return_exceptions=True,
+        )
+
+        for component, outcome in zip(self.components, outcomes, strict=True):
+            name = component.__class__.__name__
+            if isinstance(outcome, Exception):
                 logger.error(
                     "Health check failed",
-                    component=component.__class__.__name__,
-                    error=str(e),
+                    component=name,
+                    error=str(outcome),
                 )
-                results[component.__class__.__name__] = {
+                results[name] = {
                     "status": HealthStatus.UNHEALTHY,
-                    "error": str(e),
+                    "error": str(outcome),
                 }
-                status = HealthStatus.UNHEALTHY
+                worst = _UNHEALTHY_SEVERITY
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+            results[name] = outcome
+            # Unrecognised statuses count as healthy, as before
+            worst = max(worst, _SEVERITY.get(outcome["status"], 0))
 
-        return {
-            "status": status,
+        result = {
+            "status": _BY_SEVERITY[worst],
             "uptime": time.time() - self.start_time,
             "components": results,
         }
+        # The cache keeps a private copy; the caller owns the returned dict
+        self._health_cache = (time.monotonic(), copy.deepcopy(result))
+        return result
 
 
 class CoreHealth(HealthCheck):
@@ -76,9 +155,8 @@ class CoreHealth(HealthCheck):
     async def check_health(self) -> dict:
         """Check core component health."""
         try:
-            # Check critical services
-            await self.check_database()
-            await self.check_cache()
+            # Check critical services; they are independent, so run together
+            await asyncio.gather(self.check_database(), self.check_cache())
 
             return {
                 "status": HealthStatus.HEALTHY,
@@ -1,15 +1,20 @@
 # src/mcp_core/logger/logger.py
-import json
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
 import time
 from collections.abc import Callable, Coroutine
 from datetime import datetime
-from functools import wraps
-from logging.handlers import RotatingFileHandler
+from functools import lru_cache, wraps
+from logging.handlers import QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
+import orjson
+
 if TYPE_CHECKING:
     from ...config import AppConfig, LoggingConfig
 
@@ -18,7 +23,54 @@ _is_logging_configured = False
 _global_log_config: Optional["LoggingConfig"] = None
 _global_logs_path: Path | None = None
 _configured_formatter: logging.Formatter | None = None
-_log_handlers: dict[str, logging.FileHandler] = {}  # Cache handlers by file path
+# Cache handlers by (logs path, service name)
+_log_handlers: dict[tuple[Path, str], logging.FileHandler] = {}
+_log_handlers_lock = threading.Lock()  # Guards handler creation across threads
+# File writes are handed to a background listener through this queue
+_log_queue: queue.SimpleQueue | None = None
+_queue_listener: QueueListener | None = None
+_log_file_date: str | None = None  # Date stamp for log file names, fixed at setup
+
+# Local timezone resolved once at import rather than per log record. The
+# offset is fixed, so timestamps stay correct instants across DST changes.
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+# Level names accepted by StructuredLogger._log and configure_logging
+_LEVEL_INTS: dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Standard LogRecord attributes that are never copied into the JSON output
+_RESERVED_LOGRECORD_ATTRS = frozenset(
+    {
+        "args",
+        "asctime",
+        "created",
+        "exc_info",
+        "exc_text",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "msg",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "thread",
+        "threadName",
+    }
+)
 
 
 # --- JSON Formatter (keep as before) ---
@@ -28,9 +80,8 @@ class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         # Create base log record with standard fields
         log_record = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=datetime.now().astimezone().tzinfo
-            ).isoformat(),
+            # orjson renders aware datetimes as RFC 3339 natively
+            "timestamp": datetime.fromtimestamp(record.created, tz=_LOCAL_TZ),
             "level": record.levelname,
             "name": record.name,
             "message": record.getMessage(),
@@ -40,30 +91,7 @@ class JsonFormatter(logging.Formatter):
         # This avoids direct attribute access that the linter complains about
         for key, value in record.__dict__.items():
             # Skip standard LogRecord attributes and internal attributes
-            if key not in {
-                "args",
-                "asctime",
-                "created",
-                "exc_info",
-                "exc_text",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "message",
-                "msg",
-                "name",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "thread",
-                "threadName",
-            } and not key.startswith("_"):
+            if key not in _RESERVED_LOGRECORD_ATTRS and not key.startswith("_"):
                 log_record[key] = value
 
         # Handle exception info
@@ -74,7 +102,82 @@ class JsonFormatter(logging.Formatter):
         if record.stack_info:
             log_record["stack_info"] = self.formatStack(record.stack_info)
 
-        return json.dumps(log_record, default=str)
+        return orjson.dumps(
+            log_record, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+
+# --- Background File Writing ---
+class _QueuedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler whose writes happen on the background listener."""
+
+    def __init__(
+        self, *args: Any, log_queue: queue.SimpleQueue | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._log_queue = log_queue
+
+    def handle(self, record: logging.LogRecord) -> bool | logging.LogRecord:
+        if self._log_queue is None:
+            return super().handle(record)
+        rv = self.filter(record)
+        if rv:
+            # Render on the caller, as QueueHandler.prepare does, so later
+            # mutation of logged args/extra values cannot change the line and
+            # traceback frames are not kept alive; only file I/O is deferred
+            try:
+                line = self.format(record)
+            except Exception:
+                self.handleError(record)
+            else:
+                self._log_queue.put_nowait((self, line))
+        return rv
+
+    def write_record(self, line: str) -> None:
+        """Write a pre-rendered line, rolling over first if it would not fit.
+
+        Called on the listener thread; mirrors RotatingFileHandler.emit.
+        """
+        data = line + self.terminator
+        with self.lock:
+            try:
+                if self.stream is None:
+                    self.stream = self._open()
+                if self.maxBytes > 0 and os.path.isfile(self.baseFilename):
+                    pos = self.stream.tell()
+                    if pos and pos + len(data) >= self.maxBytes:
+                        self.doRollover()
+                        if self.stream is None:
+                            self.stream = self._open()
+                self.stream.write(data)
+                self.stream.flush()
+            except Exception:
+                self.handleError(logging.makeLogRecord({"msg": line}))
+
+    def detach_queue(self) -> None:
+        """Go back to writing inline, e.g. once the listener has stopped."""
+        self._log_queue = None
+
+
+class _ServiceQueueListener(QueueListener):
+    """Drains the shared queue, routing each record to its file handler."""
+
+    def handle(self, item: tuple[_QueuedRotatingFileHandler, str]) -> None:
+        target, line = item
+        target.write_record(line)
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background writer."""
+    global _log_queue, _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    _log_queue = None
+    # Anything logged after this point (late shutdown messages) is written inline
+    for handler in _log_handlers.values():
+        if isinstance(handler, _QueuedRotatingFileHandler):
+            handler.detach_queue()
 
 
 # --- Structured Logger Class ---
@@ -88,16 +191,14 @@ class StructuredLogger:
         # Configure level and handlers if global setup has run
         if _is_logging_configured and _global_log_config and _global_logs_path:
             self.logger.setLevel(_global_log_config.level.upper())
-            self._add_file_handler_if_needed(_global_log_config, _global_logs_path)
-            # Prevent double logging if root has stdout and we have a file handler
-            if _global_log_config.enable_stdout and any(
-                isinstance(h, logging.FileHandler) for h in self.logger.handlers
-            ):
-                self.logger.propagate = False
-            else:
-                self.logger.propagate = (
-                    True  # Propagate to root (for stdout) if no file handler added
-                )
+            has_file_handler = self._add_file_handler_if_needed(
+                _global_log_config, _global_logs_path
+            )
+            # Prevent double logging if root has stdout and we have a file handler;
+            # otherwise propagate to root (for stdout)
+            self.logger.propagate = not (
+                _global_log_config.enable_stdout and has_file_handler
+            )
         else:
             # Default level before configuration, might get overwritten
             self.logger.setLevel(logging.INFO)
@@ -105,116 +206,153 @@ class StructuredLogger:
 
     def _add_file_handler_if_needed(
         self, log_cfg: "LoggingConfig", base_logs_path: Path
-    ) -> None:
-        """Adds a configured RotatingFileHandler for this logger's service if not already added."""
+    ) -> bool:
+        """Adds a configured RotatingFileHandler for this logger's service if not already added.
+
+        Returns:
+            bool: Whether the logger now has its service file handler
+        """
         global _configured_formatter, _log_handlers
 
         if not _configured_formatter:  # Should not happen if setup_global_logging ran
             print("WARN: Logger formatter not configured.", file=sys.stderr)
-            return
+            return False
+
+        with _log_handlers_lock:
+            return self._attach_service_handler(log_cfg, base_logs_path)
+
+    def _attach_service_handler(
+        self, log_cfg: "LoggingConfig", base_logs_path: Path
+    ) -> bool:
+        """Attach the cached or a new file handler; caller holds the lock."""
+        # Reuse the handler already built for this service, if any
+        handler_key = (base_logs_path, self.name)
+        cached_handler = _log_handlers.get(handler_key)
+        if cached_handler is not None:
+            if cached_handler not in self.logger.handlers:
+                self.logger.addHandler(cached_handler)
+            return True
 
         try:
             # Determine service dir and log file path
             log_dir = get_log_dir(base_logs_path, self.name)
             log_file = log_dir / log_cfg.file_name_template.format(
                 service=self.name.replace(".", "_"),  # Sanitize name for filename
-                date=datetime.now().strftime("%Y%m%d"),
+                date=_log_file_date or datetime.now().strftime("%Y%m%d"),
             )
-            log_file_str = str(log_file)
 
-            # Check if a handler for this *specific file* already exists
-            if log_file_str in _log_handlers:
-                # Add existing handler to this logger if not already present
-                if _log_handlers[log_file_str] not in self.logger.handlers:
-                    self.logger.addHandler(_log_handlers[log_file_str])
-            else:
-                # Create, configure, and cache new handler
-                file_handler = RotatingFileHandler(
-                    log_file,
-                    maxBytes=log_cfg.max_size_mb * 1024 * 1024,
-                    backupCount=log_cfg.backup_count,
-                    encoding="utf-8",
-                )
-                file_handler.setFormatter(_configured_formatter)
-                self.logger.addHandler(file_handler)
-                _log_handlers[log_file_str] = file_handler  # Cache it
-                # Use basic print as this might be called before root logger is fully ready
-                # print(f"INFO: Added file handler for {self.name} to {log_file_str}")
+            # Create, configure, and cache new handler
+            # Writes go through the background listener when it is running
+            file_handler = _QueuedRotatingFileHandler(
+                log_file,
+                maxBytes=log_cfg.max_size_mb * 1024 * 1024,
+                backupCount=log_cfg.backup_count,
+                encoding="utf-8",
+                log_queue=_log_queue,
+            )
+            file_handler.setFormatter(_configured_formatter)
+            self.logger.addHandler(file_handler)
+            _log_handlers[handler_key] = file_handler  # Cache it
+            # Use basic print as this might be called before root logger is fully ready
+            # print(f"INFO: Added file handler for {self.name} to {log_file}")
+            return True
 
         except Exception as e:
             print(
                 f"ERROR: Failed to add file handler for {self.name}: {e}",
                 file=sys.stderr,
             )
+            return False
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - mirror logging API
+        """Return whether a record at ``level`` would be emitted.
+
+        Lets hot call sites skip building expensive log payloads.
+        """
+        return self.logger.isEnabledFor(level)
 
     def _log(
         self,
         level_name: str,
         message: str,
+        *args: Any,
         exc_info: bool | tuple | None = None,
         stack_info: bool | None = None,
         **kwargs: Any,
     ) -> None:
-        # Convert level name to numeric level using direct attribute access instead of deprecated getLevelName
-        try:
-            level = getattr(logging, level_name.upper())
-        except AttributeError:
-            # Fallback to INFO if level name is invalid
-            level = logging.INFO
-
-        # Only log if this level is enabled
-        if self.logger.isEnabledFor(level):
-            # Ensure stack_info is a boolean, not None
-            stack_info_bool = bool(stack_info) if stack_info is not None else False
-
-            # Instead of using a context dict, pass each kwarg as a separate extra field
-            extra_data = {}
-            for key, value in kwargs.items():
-                extra_data[key] = value
-
-            self.logger.log(
-                level,
-                message,
-                exc_info=exc_info,
-                stack_info=stack_info_bool,
-                extra=extra_data,  # Pass kwargs directly as extra fields
-            )
+        level = _LEVEL_INTS.get(level_name, logging.INFO)
+        # Bail out before touching the payload when the level is disabled
+        if not self.logger.isEnabledFor(level):
+            return
+
+        self.logger.log(
+            level,
+            message,
+            *args,  # %-style args, formatted only when the record is emitted
+            exc_info=exc_info,
+            stack_info=bool(stack_info),
+            extra=kwargs,  # Each kwarg becomes a separate extra field
+        )
 
     # --- Public Logging Methods (keep as before) ---
-    def debug(self, message: str, **kwargs: Any) -> None:
-        self._log("DEBUG", message, **kwargs)
+    # Each method checks its level first so disabled calls skip _log entirely.
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log("DEBUG", message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
-        self._log("INFO", message, **kwargs)
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log("INFO", message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
-        self._log("WARNING", message, **kwargs)
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log("WARNING", message, *args, **kwargs)
 
     def error(
         self,
         message: str,
+        *args: Any,
         exc_info: bool | tuple | None = None,
         stack_info: bool | None = None,
         **kwargs: Any,
     ) -> None:
-        self._log("ERROR", message, exc_info=exc_info, stack_info=stack_info, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(
+                "ERROR",
+                message,
+                *args,
+                exc_info=exc_info,
+                stack_info=stack_info,
+                **kwargs,
+            )
 
     def critical(
         self,
         message: str,
+        *args: Any,
         exc_info: bool | tuple | None = None,
         stack_info: bool | None = None,
         **kwargs: Any,
     ) -> None:
-        self._log(
-            "CRITICAL", message, exc_info=exc_info, stack_info=stack_info, **kwargs
-        )
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self._log(
+                "CRITICAL",
+                message,
+                *args,
+                exc_info=exc_info,
+                stack_info=stack_info,
+                **kwargs,
+            )
 
 
 # --- Global Logging Setup ---
+@lru_cache(maxsize=256)
 def get_log_dir(base_log_path: Path, service_name: str) -> Path:
     """Get the appropriate log directory for a service.
 
+    Results are memoized, so the directory is created once per
+    (base path, service) pair.
+
     Args:
         base_log_path: Base logs directory
         service_name: Name of the service/logger (dot notation)
@@ -257,7 +395,10 @@ def configure_logging(config: "AppConfig") -> None:
         _is_logging_configured, \
         _global_log_config, \
         _global_logs_path, \
-        _configured_formatter
+        _configured_formatter, \
+        _log_file_date, \
+        _log_queue, \
+        _queue_listener
 
     if _is_logging_configured:
         print("INFO: Logging already configured.")
@@ -274,12 +415,15 @@ def configure_logging(config: "AppConfig") -> None:
         logs_path / "tools",
         logs_path / "misc",
     ]
-    for directory in required_dirs:
+    # Only pay for mkdir on directories that are actually missing
+    created = [d for d in required_dirs if not d.is_dir()]
+    for directory in created:
         directory.mkdir(parents=True, exist_ok=True)
-        print(f"INFO: Ensured log directory exists: {directory}")
+    if created:
+        print(f"INFO: Created log directories: {', '.join(map(str, created))}")
 
     root_logger = logging.getLogger()
-    log_level_int = logging.getLevelName(config.get_effective_log_level())
+    log_level_int = _LEVEL_INTS.get(config.get_effective_log_level(), logging.INFO)
 
     root_logger.setLevel(log_level_int)
 
@@ -309,6 +453,14 @@ def configure_logging(config: "AppConfig") -> None:
     # Store config for StructuredLogger instances to use
     _global_log_config = log_config
     _global_logs_path = logs_path
+    _log_file_date = datetime.now().strftime("%Y%m%d")
+
+    # Start the single background writer for all service log files
+    if _queue_listener is None:
+        _log_queue = queue.SimpleQueue()
+        _queue_listener = _ServiceQueueListener(_log_queue)
+        _queue_listener.start()
+        atexit.register(_stop_queue_listener)
     _is_logging_configured = True
 
     print(f"INFO: Root logger level set to {log_config.level}")
@@ -321,24 +473,30 @@ def log_execution_time(logger_instance: StructuredLogger) -> Callable:
     def decorator(
         func: Callable[..., Coroutine[Any, Any, Any]],
     ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        # Resolved once per decorated function rather than per call
+        func_name = func.__name__
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            start_time = time.time()
-            func_name = func.__name__
+            start_ns = time.perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
-                execution_time = (time.time() - start_time) * 1000  # milliseconds
-                logger_instance.debug(
-                    f"{func_name} completed",
-                    duration_ms=f"{execution_time:.2f}",
-                    function=func_name,
-                )
+                # Skip the duration formatting entirely when DEBUG is off
+                if logger_instance.isEnabledFor(logging.DEBUG):
+                    execution_ms = (time.perf_counter_ns() - start_ns) / 1e6
+                    logger_instance.debug(
+                        "%s completed",
+                        func_name,
+                        duration_ms=f"{execution_ms:.2f}",
+                        function=func_name,
+                    )
                 return result
             except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
+                execution_ms = (time.perf_counter_ns() - start_ns) / 1e6
                 logger_instance.error(
-                    f"{func_name} failed",
-                    duration_ms=f"{execution_time:.2f}",
+                    "%s failed",
+                    func_name,
+                    duration_ms=f"{execution_ms:.2f}",
                     function=func_name,
                     error=str(e),
                     exc_info=True,  # Capture traceback
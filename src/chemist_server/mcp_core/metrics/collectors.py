@@ -2,13 +2,15 @@
 
 import time
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from ..logger import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class Metric:
     """Base class for metrics."""
 
@@ -17,7 +19,7 @@ class Metric:
     labels: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Counter(Metric):
     """Counter metric type."""
 
@@ -32,7 +34,7 @@ class Counter(Metric):
         self.value += amount
 
 
-@dataclass
+@dataclass(slots=True)
 class Gauge(Metric):
     """Gauge metric type."""
 
@@ -63,7 +65,7 @@ class Gauge(Metric):
         self.value -= amount
 
 
-@dataclass
+@dataclass(slots=True)
 class Histogram(Metric):
     """Histogram metric type."""
 
@@ -82,15 +84,26 @@ class Histogram(Metric):
             10,
         ]
     )
-    bucket_values: dict[float, int] = field(default_factory=dict)
     sum: float = 0.0
     count: int = 0
+    # Sorted upper bounds (ending in +Inf) and per-bucket, non-cumulative counts
+    _boundaries: tuple[float, ...] = field(init=False, repr=False)
+    _counts: list[int] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize bucket values."""
-        self.bucket_values = dict.fromkeys(self.buckets, 0)
-        # Add Inf bucket
-        self.bucket_values[float("inf")] = 0
+        """Initialize bucket boundaries and counters."""
+        self._boundaries = (*sorted(set(self.buckets)), float("inf"))
+        self._counts = [0] * len(self._boundaries)
+
+    @property
+    def bucket_values(self) -> dict[float, int]:
+        """Cumulative count per bucket upper bound, including +Inf."""
+        values = {}
+        total = 0
+        for boundary, count in zip(self._boundaries, self._counts, strict=True):
+            total += count
+            values[boundary] = total
+        return values
 
     def observe(self, value: float) -> None:
         """Record an observation.
@@ -101,10 +114,64 @@ class Histogram(Metric):
         self.sum += value
         self.count += 1
 
-        # Update buckets
-        for bucket in self.buckets + [float("inf")]:
-            if value <= bucket:
-                self.bucket_values[bucket] += 1
+        # First bucket whose upper bound is >= value; cumulated on read
+        self._counts[bisect_left(self._boundaries, value)] += 1
+
+    def flush(self) -> None:
+        """Apply buffered observations.
+
+        Plain histograms record eagerly, so there is nothing to apply.
+        """
+
+
+@dataclass(slots=True)
+class BatchingHistogram(Histogram):
+    """Histogram that buffers observations and buckets them in bulk.
+
+    ``observe`` keeps ``sum`` and ``count`` current but only appends the value
+    to a float buffer; bucketing is deferred to ``flush``, which runs when the
+    buffer reaches ``max_pending`` and whenever ``bucket_values`` is read.
+    """
+
+    max_pending: int = 1024
+    _pending: array = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Initialize bucket boundaries, counters and the pending buffer."""
+        Histogram.__post_init__(self)
+        self._pending = array("d")
+
+    @property
+    def bucket_values(self) -> dict[float, int]:
+        """Cumulative count per bucket upper bound, including +Inf."""
+        self.flush()
+        return Histogram.bucket_values.fget(self)
+
+    def observe(self, value: float) -> None:
+        """Buffer an observation.
+
+        Args:
+            value: Value to observe
+        """
+        self.sum += value
+        self.count += 1
+
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= self.max_pending:
+            self.flush()
+
+    def flush(self) -> None:
+        """Bucket all buffered observations."""
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = array("d")
+
+        boundaries = self._boundaries
+        counts = self._counts
+        for value in pending:
+            counts[bisect_left(boundaries, value)] += 1
 
 
 class MetricsCollector(ABC):
@@ -117,6 +184,7 @@ class MetricsCollector(ABC):
             namespace: Metrics namespace
         """
         self.namespace = namespace
+        self._prefix = namespace + "_"
         self.counters: dict[str, Counter] = {}
         self.gauges: dict[str, Gauge] = {}
         self.histograms: dict[str, Histogram] = {}
@@ -134,7 +202,7 @@ class MetricsCollector(ABC):
         Returns:
             Counter: New counter metric
         """
-        full_name = f"{self.namespace}_{name}"
+        full_name = self._prefix + name
         counter = Counter(full_name, description, labels or {})
         self.counters[full_name] = counter
         return counter
@@ -152,7 +220,7 @@ class MetricsCollector(ABC):
         Returns:
             Gauge: New gauge metric
         """
-        full_name = f"{self.namespace}_{name}"
+        full_name = self._prefix + name
         gauge = Gauge(full_name, description, labels or {})
         self.gauges[full_name] = gauge
         return gauge
@@ -163,6 +231,7 @@ class MetricsCollector(ABC):
         description: str,
         buckets: list[float] | None = None,
         labels: dict[str, str] | None = None,
+        batching: bool = False,
     ) -> Histogram:
         """Create a histogram metric.
 
@@ -171,12 +240,14 @@ class MetricsCollector(ABC):
             description: Metric description
             buckets: Histogram buckets
             labels: Metric labels
+            batching: Buffer observations and bucket them in bulk on flush
 
         Returns:
             Histogram: New histogram metric
         """
-        full_name = f"{self.namespace}_{name}"
-        histogram = Histogram(full_name, description, labels or {}, buckets or [])
+        full_name = self._prefix + name
+        histogram_cls = BatchingHistogram if batching else Histogram
+        histogram = histogram_cls(full_name, description, labels or {}, buckets or [])
         self.histograms[full_name] = histogram
         return histogram
 
@@ -219,11 +290,20 @@ class RequestMetricsCollector(MetricsCollector):
         )
 
         self.request_duration = self.create_histogram(
-            "duration_seconds", "Request duration in seconds"
+            "duration_seconds", "Request duration in seconds", batching=True
         )
 
         self.request_active = self.create_gauge("active", "Number of active requests")
 
+        # Bind hot-path operations once so each request skips the attribute walk
+        self._inc_total = self.request_count.increment
+        self._inc_success = self.request_success_count.increment
+        self._inc_error = self.request_error_count.increment
+        self._inc_active = self.request_active.increment
+        self._dec_active = self.request_active.decrement
+        self._observe_duration = self.request_duration.observe
+        self._now = time.perf_counter_ns  # monotonic, integer nanoseconds
+
         logger.info("Request metrics collector initialized")
 
     def collect(self) -> None:
@@ -231,34 +311,34 @@ class RequestMetricsCollector(MetricsCollector):
         # This collector is updated in real-time, so no collection needed
         pass
 
-    def record_request_start(self) -> float:
+    def record_request_start(self) -> int:
         """Record the start of a request.
 
         Returns:
-            float: Start timestamp
+            int: Monotonic start time in nanoseconds
         """
-        self.request_count.increment()
-        self.request_active.increment()
-        return time.time()
+        self._inc_total()
+        self._inc_active()
+        return self._now()
 
-    def record_request_end(self, start_time: float, success: bool = True) -> float:
+    def record_request_end(self, start_time: int, success: bool = True) -> float:
         """Record the end of a request.
 
         Args:
-            start_time: Request start timestamp
+            start_time: Value returned by record_request_start
             success: Whether request was successful
 
         Returns:
             float: Request duration in seconds
         """
-        duration = time.time() - start_time
-        self.request_duration.observe(duration)
-        self.request_active.decrement()
+        duration = (self._now() - start_time) * 1e-9
+        self._observe_duration(duration)
+        self._dec_active()
 
         if success:
-            self.request_success_count.increment()
+            self._inc_success()
         else:
-            self.request_error_count.increment()
+            self._inc_error()
 
         return duration
 
@@ -284,13 +364,24 @@ class ToolMetricsCollector(MetricsCollector):
         )
 
         self.tool_duration = self.create_histogram(
-            "duration_seconds", "Tool call duration in seconds"
+            "duration_seconds", "Tool call duration in seconds", batching=True
         )
 
         # Track tool-specific metrics
         self.tool_specific_calls: dict[str, Counter] = {}
         self.tool_specific_errors: dict[str, Counter] = {}
         self.tool_specific_durations: dict[str, Histogram] = {}
+        # (tool_name, tool_version) -> (calls, errors, durations), resolved once
+        self._tool_bundles: dict[
+            tuple[str, str], tuple[Counter, Counter, Histogram]
+        ] = {}
+
+        # Bind hot-path operations once so each call skips the attribute walk
+        self._inc_calls = self.tool_call_count.increment
+        self._inc_success = self.tool_success_count.increment
+        self._inc_error = self.tool_error_count.increment
+        self._observe_duration = self.tool_duration.observe
+        self._now = time.perf_counter_ns  # monotonic, integer nanoseconds
 
         logger.info("Tool metrics collector initialized")
 
@@ -306,26 +397,34 @@ class ToolMetricsCollector(MetricsCollector):
             tool_name: Name of the tool
             tool_version: Version of the tool
         """
-        tool_id = f"{tool_name}_{tool_version}"
-
         # Create tool-specific metrics if not already created
-        if tool_id not in self.tool_specific_calls:
+        if (tool_name, tool_version) not in self._tool_bundles:
+            tool_id = tool_name + "_" + tool_version
+            tool_label = f"tool {tool_name} v{tool_version}"
+
             self.tool_specific_calls[tool_id] = self.create_counter(
-                f"calls_total_{tool_id}",
-                f"Total calls for tool {tool_name} v{tool_version}",
+                "calls_total_" + tool_id,
+                "Total calls for " + tool_label,
                 {"tool": tool_name, "version": tool_version},
             )
 
             self.tool_specific_errors[tool_id] = self.create_counter(
-                f"errors_total_{tool_id}",
-                f"Total errors for tool {tool_name} v{tool_version}",
+                "errors_total_" + tool_id,
+                "Total errors for " + tool_label,
                 {"tool": tool_name, "version": tool_version},
             )
 
             self.tool_specific_durations[tool_id] = self.create_histogram(
-                f"duration_seconds_{tool_id}",
-                f"Call duration for tool {tool_name} v{tool_version}",
+                "duration_seconds_" + tool_id,
+                "Call duration for " + tool_label,
                 labels={"tool": tool_name, "version": tool_version},
+                batching=True,
+            )
+
+            self._tool_bundles[(tool_name, tool_version)] = (
+                self.tool_specific_calls[tool_id],
+                self.tool_specific_errors[tool_id],
+                self.tool_specific_durations[tool_id],
             )
 
             logger.info(
@@ -334,7 +433,7 @@ class ToolMetricsCollector(MetricsCollector):
                 version=tool_version,
             )
 
-    def record_tool_call_start(self, tool_name: str, tool_version: str) -> float:
+    def record_tool_call_start(self, tool_name: str, tool_version: str) -> int:
         """Record the start of a tool call.
 
         Args:
@@ -342,24 +441,24 @@ class ToolMetricsCollector(MetricsCollector):
             tool_version: Version of the tool
 
         Returns:
-            float: Start timestamp
+            int: Monotonic start time in nanoseconds
         """
-        self.tool_call_count.increment()
+        self._inc_calls()
 
         # Update tool-specific metrics
-        tool_id = f"{tool_name}_{tool_version}"
-        if tool_id in self.tool_specific_calls:
-            self.tool_specific_calls[tool_id].increment()
+        bundle = self._tool_bundles.get((tool_name, tool_version))
+        if bundle is not None:
+            bundle[0].increment()
 
-        return time.time()
+        return self._now()
 
     def record_tool_call_end(
-        self, start_time: float, tool_name: str, tool_version: str, success: bool = True
+        self, start_time: int, tool_name: str, tool_version: str, success: bool = True
     ) -> float:
         """Record the end of a tool call.
 
         Args:
-            start_time: Call start timestamp
+            start_time: Value returned by record_tool_call_start
             tool_name: Name of the tool
             tool_version: Version of the tool
             success: Whether call was successful
@@ -367,21 +466,20 @@ class ToolMetricsCollector(MetricsCollector):
         Returns:
             float: Call duration in seconds
         """
-        duration = time.time() - start_time
-        self.tool_duration.observe(duration)
+        duration = (self._now() - start_time) * 1e-9
+        self._observe_duration(duration)
 
         if success:
-            self.tool_success_count.increment()
+            self._inc_success()
         else:
-            self.tool_error_count.increment()
+            self._inc_error()
 
         # Update tool-specific metrics
-        tool_id = f"{tool_name}_{tool_version}"
-        if tool_id in self.tool_specific_durations:
-            self.tool_specific_durations[tool_id].observe(duration)
-
-        if not success and tool_id in self.tool_specific_errors:
-            self.tool_specific_errors[tool_id].increment()
+        bundle = self._tool_bundles.get((tool_name, tool_version))
+        if bundle is not None:
+            bundle[2].observe(duration)
+            if not success:
+                bundle[1].increment()
 
         return duration
 
@@ -127,6 +127,7 @@ class PrometheusExporter(MetricsExporter):
             name: Metric name
             histogram: Histogram metric
         """
+        histogram.flush()
         base_labels = histogram.labels.copy()
 
         # Add bucket samples
@@ -196,6 +197,7 @@ class JsonFileExporter(MetricsExporter):
                     "labels": metric.labels,
                 }
             elif isinstance(metric, Histogram):
+                metric.flush()
                 data["metrics"][metric.name] = {
                     "type": "histogram",
                     "buckets": {str(k): v for k, v in metric.bucket_values.items()},
@@ -1,6 +1,12 @@
 """Models package for MCP Core data structures."""
 
-from .request import CoreRequest, RequestContext
+from .request import CoreRequest, RequestContext, set_correlation_id_factory
 from .response import CoreResponse, ErrorResponse
 
-__all__ = ["CoreRequest", "CoreResponse", "ErrorResponse", "RequestContext"]
+__all__ = [
+    "CoreRequest",
+    "CoreResponse",
+    "ErrorResponse",
+    "RequestContext",
+    "set_correlation_id_factory",
+]
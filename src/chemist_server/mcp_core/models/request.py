@@ -2,26 +2,43 @@
 
 import time
 import uuid
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+
+def _new_correlation_id() -> str:
+    """Generate a random hyphen-free correlation ID."""
+    return uuid.uuid4().hex
+
+
+_correlation_id_factory: Callable[[], str] = _new_correlation_id
+
+
+def set_correlation_id_factory(factory: Callable[[], str] | None) -> None:
+    """Override how default correlation IDs are generated.
+
+    Lets tracing integrations supply their own IDs (e.g. trace IDs).
+
+    Args:
+        factory: Zero-argument callable returning an ID, or None to restore
+            the default random generator
+    """
+    global _correlation_id_factory
+    _correlation_id_factory = factory or _new_correlation_id
 
 
 class RequestContext(BaseModel):
     """Context information for a request."""
 
-    correlation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    correlation_id: str = Field(default_factory=lambda: _correlation_id_factory())
     timestamp: float = Field(default_factory=time.time)
     user_id: str | None = None
     session_id: str | None = None
     source: str | None = None
     extra: dict[str, Any] = Field(default_factory=dict)
 
-    class Config:
-        """Pydantic configuration."""
-
-        json_encoders = {uuid.UUID: str}
-
 
 class CoreRequest(BaseModel):
     """Core request model for MCP."""
@@ -30,11 +47,5 @@ class CoreRequest(BaseModel):
     parameters: dict[str, Any] = Field(default_factory=dict)
     context: RequestContext = Field(default_factory=RequestContext)
     version: str | None = None
-    timeout: float | None = None
-
-    @field_validator("timeout")
-    def validate_timeout(self, value: float | None) -> float | None:
-        """Validate timeout is positive."""
-        if value is not None and value <= 0:
-            raise ValueError("Timeout must be positive")
-        return value
+    # Must be positive; checked by pydantic-core without a Python callback
+    timeout: float | None = Field(default=None, gt=0)
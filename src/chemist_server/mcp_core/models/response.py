@@ -54,7 +54,7 @@ class CoreResponse(BaseModel):
             ErrorResponse: Error response model
         """
         if isinstance(error, Exception) and not isinstance(error, ErrorDetail):
-            error_detail = ErrorDetail(
+            error_detail = ErrorDetail.model_construct(
                 code="INTERNAL_ERROR",
                 message=str(error),
                 details={"exception_type": error.__class__.__name__},
@@ -62,6 +62,9 @@ class CoreResponse(BaseModel):
         else:
             error_detail = error  # type: ignore
 
-        return ErrorResponse(
-            error=error_detail, correlation_id=correlation_id, timestamp=time.time()
+        return ErrorResponse.model_construct(
+            success=False,
+            error=error_detail,
+            correlation_id=correlation_id,
+            timestamp=time.time(),
         )
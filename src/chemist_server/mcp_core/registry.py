@@ -3,15 +3,38 @@
 This module provides the central registry for managing tool registrations and versions.
 """
 
+import asyncio
+import sys
 import time
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 from .adapters.base_adapter import BaseAdapter
 from .adapters.circuit_breaker import CircuitBreaker
 from .errors import AdapterError, CircuitBreakerError
 from .logger import logger
 
+# Fraction of recovery_timeout added at random when a tool's circuit opens,
+# so breakers that tripped together do not all probe at the same moment
+DEFAULT_RECOVERY_JITTER = 0.1
+
+# Canonical tag sets, so tools registered with the same tags share one object
+_tag_cache: dict[frozenset[str], frozenset[str]] = {}
+
+
+def _intern_tags(tags: Iterable[str]) -> frozenset[str]:
+    """Return the shared frozenset for a collection of tags.
+
+    Args:
+        tags: Tag names
+
+    Returns:
+        frozenset[str]: Interned, immutable tag set
+    """
+    tag_set = frozenset(map(sys.intern, tags))
+    return _tag_cache.setdefault(tag_set, tag_set)
+
 
 @dataclass
 class ToolMetadata:
@@ -24,7 +47,7 @@ class ToolMetadata:
     created_at: float = field(default_factory=time.time)
     updated_at: float = field(default_factory=time.time)
     is_active: bool = True
-    tags: set[str] = field(default_factory=set)
+    tags: frozenset[str] = frozenset()
     circuit_breaker_enabled: bool = True
     circuit_breaker_threshold: int = 5
     recovery_timeout: float = 30.0
@@ -32,6 +55,16 @@ class ToolMetadata:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class ToolListEntry(NamedTuple):
+    """Summary of one registered tool version."""
+
+    tool_name: str
+    version: str
+    is_latest: bool
+    description: str
+    adapter_type: str
+
+
 class ToolRegistry:
     """Registry for MCP tools.
 
@@ -51,6 +84,9 @@ class ToolRegistry:
             str, CircuitBreaker
         ] = {}  # tool_name:version -> circuit breaker
         self.latest_versions: dict[str, str] = {}  # tool_name -> latest version
+        self._dispatch: dict[
+            tuple[str, str], tuple[BaseAdapter, ToolMetadata, CircuitBreaker]
+        ] = {}  # (tool_name, version) -> (adapter, metadata, circuit breaker)
 
     def register_tool(
         self,
@@ -91,11 +127,13 @@ class ToolRegistry:
         failure_threshold = kwargs.get("circuit_breaker_threshold", 5)
         recovery_timeout = kwargs.get("recovery_timeout", 30.0)
 
-        self.circuit_breakers[circuit_name] = CircuitBreaker(
+        circuit_breaker = CircuitBreaker(
             name=circuit_name,
             failure_threshold=failure_threshold,
             recovery_timeout=recovery_timeout,
+            recovery_jitter=kwargs.get("recovery_jitter", DEFAULT_RECOVERY_JITTER),
         )
+        self.circuit_breakers[circuit_name] = circuit_breaker
 
         # Store metadata
         tool_metadata = ToolMetadata(
@@ -103,7 +141,7 @@ class ToolRegistry:
             adapter_type=adapter.__class__.__name__,
             version=version,
             description=kwargs.get("description", ""),
-            tags=set(kwargs.get("tags", [])),
+            tags=_intern_tags(kwargs.get("tags", ())),
             circuit_breaker_enabled=kwargs.get("circuit_breaker_enabled", True),
             circuit_breaker_threshold=failure_threshold,
             recovery_timeout=recovery_timeout,
@@ -112,6 +150,7 @@ class ToolRegistry:
         )
 
         self.metadata[tool_name][version] = tool_metadata
+        self._dispatch[(tool_name, version)] = (adapter, tool_metadata, circuit_breaker)
 
         # Update latest version if requested
         if make_latest or tool_name not in self.latest_versions:
@@ -180,27 +219,35 @@ class ToolRegistry:
 
         return self.metadata[tool_name][version]
 
-    def list_tools(self) -> list[dict[str, Any]]:
-        """List all registered tools.
+    def iter_tools(self) -> Iterator[ToolListEntry]:
+        """Iterate over all registered tool versions.
 
-        Returns:
-            List[Dict[str, Any]]: List of tool metadata
+        Yields tuples instead of dicts, for callers that only need to scan
+        the registry.
+
+        Yields:
+            ToolListEntry: Summary of each registered tool version
         """
-        result = []
+        latest_versions = self.latest_versions
         for tool_name, versions in self.metadata.items():
+            latest = latest_versions.get(tool_name)
             for version, metadata in versions.items():
-                is_latest = self.latest_versions.get(tool_name) == version
-                result.append(
-                    {
-                        "tool_name": tool_name,
-                        "version": version,
-                        "is_latest": is_latest,
-                        "description": metadata.description,
-                        "adapter_type": metadata.adapter_type,
-                    }
+                yield ToolListEntry(
+                    tool_name,
+                    version,
+                    version == latest,
+                    metadata.description,
+                    metadata.adapter_type,
                 )
 
-        return result
+    def list_tools(self) -> list[dict[str, Any]]:
+        """List all registered tools.
+
+        Returns:
+            List[Dict[str, Any]]: List of tool metadata
+        """
+        # Built from iter_tools so both listings always agree
+        return [entry._asdict() for entry in self.iter_tools()]
 
     def list_versions(self, tool_name: str) -> list[str]:
         """List all versions for a tool.
@@ -270,29 +317,30 @@ class ToolRegistry:
             AdapterError: If adapter execution fails
             CircuitBreakerError: If circuit breaker is open
         """
-        # Get the appropriate version
+        # latest_versions stays the single source of truth for the default
         if version is None:
             version = self.latest_versions.get(tool_name)
             if version is None:
                 raise AdapterError(f"No versions found for tool {tool_name}")
 
-        # Get tool and metadata
-        adapter = self.get_tool(tool_name, version)
-        metadata = self.get_metadata(tool_name, version)
+        # Resolve adapter, metadata and circuit breaker in a single lookup
+        entry = self._dispatch.get((tool_name, version))
+        if entry is None:
+            if tool_name not in self.tools:
+                raise AdapterError(f"Tool {tool_name} not found")
+            raise AdapterError(f"Version {version} not found for tool {tool_name}")
+        adapter, metadata, circuit_breaker = entry
 
         # Check if circuit breaker is enabled
         if use_circuit_breaker and metadata.circuit_breaker_enabled:
-            circuit_breaker = self.get_circuit_breaker(tool_name, version)
-
             # Execute with circuit breaker
             try:
-                result = await circuit_breaker.execute(
+                return await circuit_breaker.execute(
                     adapter.execute,
                     tool_name,
                     parameters,
                     context,
                 )
-                return await result
             except CircuitBreakerError:
                 # Propagate circuit breaker errors
                 raise
@@ -313,17 +361,24 @@ class ToolRegistry:
         Raises:
             AdapterError: If shutdown fails
         """
-        errors = []
+        entries = [
+            (tool_name, version, adapter)
+            for tool_name, versions in self.tools.items()
+            for version, adapter in versions.items()
+        ]
+
+        # Shutdown all adapters concurrently, collecting failures per version
+        results = await asyncio.gather(
+            *(adapter.shutdown() for _, _, adapter in entries),
+            return_exceptions=True,
+        )
 
-        # Shutdown all adapters
-        for tool_name, versions in self.tools.items():
-            for version, adapter in versions.items():
-                try:
-                    await adapter.shutdown()
-                except Exception as e:
-                    errors.append(
-                        f"Error shutting down {tool_name} v{version}: {e!s}"
-                    )
+        errors = []
+        for (tool_name, version, _), result in zip(entries, results, strict=True):
+            if isinstance(result, Exception):
+                errors.append(f"Error shutting down {tool_name} v{version}: {result!s}")
+            elif isinstance(result, BaseException):
+                raise result
 
         if errors:
             raise AdapterError(f"Errors during shutdown: {', '.join(errors)}")
@@ -333,3 +388,4 @@ class ToolRegistry:
         self.metadata.clear()
         self.circuit_breakers.clear()
         self.latest_versions.clear()
+        self._dispatch.clear()
@@ -2,6 +2,7 @@
 
 from .schemas import (
     ToolSchema,
+    get_compiled_tool_schema,
     get_tool_schema,
     list_tool_schemas,
     register_tool_schema,
@@ -10,6 +11,7 @@ from .validators import validate_request, validate_tool_parameters
 
 __all__ = [
     "ToolSchema",
+    "get_compiled_tool_schema",
     "get_tool_schema",
     "list_tool_schemas",
     "register_tool_schema",
@@ -1,14 +1,23 @@
 """JSON Schema definitions for tool validation."""
 
+import sys
+from dataclasses import dataclass, field
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 from ..errors import ValidationError
 from ..logger import logger
 
+# Parameter type -> (min keyword, max keyword, value cast) for min/max_value
+_BOUND_KEYWORDS: dict[str, tuple[str, str, type]] = {
+    "string": ("minLength", "maxLength", int),
+    "number": ("minimum", "maximum", float),
+    "integer": ("minimum", "maximum", float),
+    "array": ("minItems", "maxItems", int),
+}
+
 
-class ParameterSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ParameterSchema:
     """Schema for a tool parameter."""
 
     name: str
@@ -21,6 +30,26 @@ class ParameterSchema(BaseModel):
     min_value: float | None = None
     max_value: float | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ParameterSchema":
+        """Create a parameter schema from a plain dict, e.g. parsed JSON.
+
+        Only checks that the expected fields are present; values are trusted.
+
+        Args:
+            data: Parameter schema fields
+
+        Returns:
+            ParameterSchema: Parameter schema
+
+        Raises:
+            ValidationError: If fields are missing or unknown
+        """
+        try:
+            return cls(**data)
+        except TypeError as e:
+            raise ValidationError(f"Invalid parameter schema: {e}") from e
+
     def to_json_schema(self) -> dict[str, Any]:
         """Convert to JSON Schema format.
 
@@ -38,33 +67,54 @@ class ParameterSchema(BaseModel):
         if self.pattern and self.type == "string":
             schema["pattern"] = self.pattern
 
-        if self.min_value is not None:
-            if self.type == "string":
-                schema["minLength"] = int(self.min_value)
-            elif self.type in ["number", "integer"]:
-                schema["minimum"] = self.min_value
-            elif self.type == "array":
-                schema["minItems"] = int(self.min_value)
-
-        if self.max_value is not None:
-            if self.type == "string":
-                schema["maxLength"] = int(self.max_value)
-            elif self.type in ["number", "integer"]:
-                schema["maximum"] = self.max_value
-            elif self.type == "array":
-                schema["maxItems"] = int(self.max_value)
+        bounds = _BOUND_KEYWORDS.get(self.type)
+        if bounds is not None:
+            min_keyword, max_keyword, cast = bounds
+            if self.min_value is not None:
+                schema[min_keyword] = cast(self.min_value)
+            if self.max_value is not None:
+                schema[max_keyword] = cast(self.max_value)
 
         return schema
 
 
-class ToolSchema(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolSchema:
     """Schema definition for a tool."""
 
     name: str
     version: str
     description: str
     parameters: list[ParameterSchema]
-    required_parameters: list[str] = Field(default_factory=list)
+    required_parameters: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ToolSchema":
+        """Create a tool schema from a plain dict, e.g. parsed JSON.
+
+        Only checks that the expected fields are present; values are trusted.
+
+        Args:
+            data: Tool schema fields, with parameters as dicts
+
+        Returns:
+            ToolSchema: Tool schema
+
+        Raises:
+            ValidationError: If data is not a mapping, or fields are missing
+                or unknown
+        """
+        try:
+            fields = dict(data)
+            parameters = fields["parameters"]
+            fields["parameters"] = [
+                ParameterSchema.from_dict(param) for param in parameters
+            ]
+            return cls(**fields)
+        except KeyError as e:
+            raise ValidationError(f"Invalid tool schema: missing field {e}") from e
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid tool schema: {e}") from e
 
     def to_json_schema(self) -> dict[str, Any]:
         """Convert to JSON Schema format.
@@ -85,8 +135,31 @@ class ToolSchema(BaseModel):
         }
 
 
-# Registry for tool schemas
-_tool_schemas: dict[str, dict[str, ToolSchema]] = {}
+# Registry for tool schemas, keyed by interned (tool name, version)
+_tool_schemas: dict[tuple[str, str], ToolSchema] = {}
+# JSON Schema documents built once at registration, same keys as above
+_compiled_tool_schemas: dict[tuple[str, str], dict[str, Any]] = {}
+# tool name -> registered versions, in registration order
+_schema_versions: dict[str, list[str]] = {}
+# tool name -> (sort key, version) of the highest registered schema version
+_latest_schema_versions: dict[str, tuple[tuple[tuple[int, Any], ...], str]] = {}
+
+
+def _version_sort_key(version: str) -> tuple[tuple[int, Any], ...]:
+    """Build a sort key ordering dotted versions numerically.
+
+    Numeric segments compare as integers (so 1.10.0 > 1.9.0); any other
+    segment sorts after them, lexically.
+
+    Args:
+        version: Version string
+
+    Returns:
+        tuple[tuple[int, Any], ...]: Comparable key for the version
+    """
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part) for part in version.split(".")
+    )
 
 
 def register_tool_schema(schema: ToolSchema) -> None:
@@ -98,15 +171,24 @@ def register_tool_schema(schema: ToolSchema) -> None:
     Raises:
         ValidationError: If schema is already registered
     """
-    if schema.name not in _tool_schemas:
-        _tool_schemas[schema.name] = {}
+    name = sys.intern(schema.name)
+    version = sys.intern(schema.version)
+    schema_key = (name, version)
 
-    if schema.version in _tool_schemas[schema.name]:
+    if schema_key in _tool_schemas:
         raise ValidationError(
-            f"Schema for tool {schema.name} version {schema.version} already registered"
+            f"Schema for tool {name} version {version} already registered"
         )
 
-    _tool_schemas[schema.name][schema.version] = schema
+    _tool_schemas[schema_key] = schema
+    _compiled_tool_schemas[schema_key] = schema.to_json_schema()
+    _schema_versions.setdefault(name, []).append(version)
+
+    sort_key = _version_sort_key(version)
+    latest = _latest_schema_versions.get(name)
+    if latest is None or sort_key > latest[0]:
+        _latest_schema_versions[name] = (sort_key, version)
+
     logger.info(
         f"Registered schema for tool {schema.name} version {schema.version}",
         tool=schema.name,
@@ -114,6 +196,34 @@ def register_tool_schema(schema: ToolSchema) -> None:
     )
 
 
+def _schema_key(name: str, version: str | None) -> tuple[str, str]:
+    """Resolve the registry key for a tool schema.
+
+    Args:
+        name: Tool name
+        version: Tool version (latest if None)
+
+    Returns:
+        tuple[str, str]: Registered (tool name, version) key
+
+    Raises:
+        ValidationError: If schema not found
+    """
+    if version is None:
+        # Latest version is tracked at registration time
+        latest = _latest_schema_versions.get(name)
+        if latest is None:
+            raise ValidationError(f"No schema registered for tool {name}")
+        return (name, latest[1])
+
+    schema_key = (name, version)
+    if schema_key not in _tool_schemas:
+        if name not in _schema_versions:
+            raise ValidationError(f"No schema registered for tool {name}")
+        raise ValidationError(f"No schema registered for tool {name} version {version}")
+    return schema_key
+
+
 def get_tool_schema(name: str, version: str | None = None) -> ToolSchema:
     """Get a tool schema.
 
@@ -127,17 +237,26 @@ def get_tool_schema(name: str, version: str | None = None) -> ToolSchema:
     Raises:
         ValidationError: If schema not found
     """
-    if name not in _tool_schemas:
-        raise ValidationError(f"No schema registered for tool {name}")
+    return _tool_schemas[_schema_key(name, version)]
 
-    if version is None:
-        # Get latest version
-        version = max(_tool_schemas[name].keys())
 
-    if version not in _tool_schemas[name]:
-        raise ValidationError(f"No schema registered for tool {name} version {version}")
+def get_compiled_tool_schema(name: str, version: str | None = None) -> dict[str, Any]:
+    """Get the JSON Schema document for a registered tool schema.
+
+    The document is built once at registration and shared between callers,
+    so it must not be mutated.
 
-    return _tool_schemas[name][version]
+    Args:
+        name: Tool name
+        version: Tool version (latest if None)
+
+    Returns:
+        dict[str, Any]: JSON Schema for the tool
+
+    Raises:
+        ValidationError: If schema not found
+    """
+    return _compiled_tool_schemas[_schema_key(name, version)]
 
 
 def list_tool_schemas() -> dict[str, list[str]]:
@@ -146,4 +265,4 @@ def list_tool_schemas() -> dict[str, list[str]]:
     Returns:
         dict[str, list[str]]: Map of tool names to lists of versions
     """
-    return {name: list(versions.keys()) for name, versions in _tool_schemas.items()}
+    return {name: list(versions) for name, versions in _schema_versions.items()}
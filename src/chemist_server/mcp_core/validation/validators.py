@@ -3,11 +3,40 @@
 from typing import Any
 
 import jsonschema
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
 
 from ..errors import ValidationError
 from ..logger import logger
 from ..models.request import CoreRequest
-from .schemas import get_tool_schema
+from .schemas import ToolSchema, get_compiled_tool_schema, get_tool_schema
+
+# Compiled validators per (tool name, schema version); registered schemas are
+# immutable, so an entry never goes stale
+_compiled_validators: dict[tuple[str, str], Validator] = {}
+
+
+def _get_validator(schema: ToolSchema) -> Validator:
+    """Get the compiled JSON Schema validator for a tool schema.
+
+    The schema document is checked once; later calls reuse the validator
+    instead of repeating that work on every request.
+
+    Args:
+        schema: Tool schema
+
+    Returns:
+        Validator: Validator bound to the tool's JSON Schema
+    """
+    key = (schema.name, schema.version)
+    validator = _compiled_validators.get(key)
+    if validator is None:
+        json_schema = get_compiled_tool_schema(schema.name, schema.version)
+        validator_cls = jsonschema.validators.validator_for(json_schema)
+        validator_cls.check_schema(json_schema)
+        validator = validator_cls(json_schema)
+        _compiled_validators[key] = validator
+    return validator
 
 
 def validate_request(request: CoreRequest) -> None:
@@ -52,20 +81,19 @@ def validate_tool_parameters(
     try:
         # Get tool schema
         schema = get_tool_schema(tool_name, version)
-        json_schema = schema.to_json_schema()
+        validator = _get_validator(schema)
 
-        # Validate against JSON Schema
-        try:
-            jsonschema.validate(instance=parameters, schema=json_schema)
-        except jsonschema.ValidationError as e:
+        # Validate against JSON Schema, reporting the most relevant error
+        error = best_match(validator.iter_errors(parameters))
+        if error is not None:
             raise ValidationError(
-                f"Parameter validation failed: {e.message}",
+                f"Parameter validation failed: {error.message}",
                 details={
-                    "path": list(e.path),
-                    "validator": e.validator,
-                    "validator_value": e.validator_value,
+                    "path": list(error.path),
+                    "validator": error.validator,
+                    "validator_value": error.validator_value,
                 },
-            ) from e
+            ) from error
     except ValidationError as e:
         if "No schema registered" in str(e):
             # No schema available, just log and continue
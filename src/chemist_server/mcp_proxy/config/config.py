@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -33,6 +35,11 @@ class ProxyConfig(BaseSettings):
     }
 
 
+@lru_cache(maxsize=1)
 def get_proxy_config() -> ProxyConfig:
-    """Get proxy configuration instance."""
+    """Get the shared proxy configuration instance.
+
+    The environment is read once; call ``get_proxy_config.cache_clear()`` to
+    pick up changed variables (e.g. in tests).
+    """
     return ProxyConfig()
@@ -4,10 +4,20 @@ import asyncio
 import os
 import platform
 import time
+from functools import lru_cache
 from typing import Any
 
 from .config.config import get_proxy_config
 
+# Static part of every health report; copied per call, then filled in
+_HEALTH_TEMPLATE: dict[str, Any] = {
+    "service": "mcp_proxy",
+    "timestamp": 0.0,
+    "healthy": True,
+    "version": "1.0.0",  # Hardcoded version since server.version doesn't exist
+    "checks": {},
+}
+
 
 async def check_health() -> dict[str, Any]:
     """Check the health of the proxy server.
@@ -19,26 +29,22 @@ async def check_health() -> dict[str, Any]:
     start_time = time.time()
 
     # Overall health status
-    health = {
-        "service": "mcp_proxy",
-        "timestamp": start_time,
-        "healthy": True,
-        "version": "1.0.0",  # Hardcoded version since server.version doesn't exist
-        "checks": {},
+    health = _HEALTH_TEMPLATE.copy()
+    health["timestamp"] = start_time
+
+    # Check system, MCP Core connectivity and transports concurrently; each
+    # check reports its own failures, so none of them raise
+    system_health, core_health, transport_health = await asyncio.gather(
+        check_system_health(),
+        check_core_connectivity(),
+        check_transport_health(),
+    )
+    health["checks"] = {
+        "system": system_health,
+        "core_connectivity": core_health,
+        "transports": transport_health,
     }
 
-    # Check system health
-    system_health = await check_system_health()
-    health["checks"]["system"] = system_health
-
-    # Check MCP Core connectivity
-    core_health = await check_core_connectivity()
-    health["checks"]["core_connectivity"] = core_health
-
-    # Check transport health
-    transport_health = await check_transport_health()
-    health["checks"]["transports"] = transport_health
-
     # Update overall health status
     health["healthy"] = (
         system_health.get("healthy", False)
@@ -52,6 +58,23 @@ async def check_health() -> dict[str, Any]:
     return health
 
 
+@lru_cache(maxsize=1)
+def _system_info() -> dict[str, Any]:
+    """Collect static system information once per process.
+
+    ``platform.platform()`` inspects the OS on every call and none of these
+    values change while the process runs.
+
+    Returns:
+        dict[str, Any]: Platform, Python version and CPU count
+    """
+    return {
+        "platform": platform.platform(),
+        "python_version": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
 async def check_system_health() -> dict:
     """Check system health.
 
@@ -63,9 +86,7 @@ async def check_system_health() -> dict:
         # Collect system information
         return {
             "healthy": True,
-            "platform": platform.platform(),
-            "python_version": platform.python_version(),
-            "cpu_count": os.cpu_count(),
+            **_system_info(),
             "memory_info": "N/A",  # Would use psutil in a real implementation
         }
     except Exception as e:
@@ -1,12 +1,14 @@
 """MCP Proxy server implementation."""
 
-import asyncio
+import itertools
 import logging
 import os
 import sys
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse
 
 from .config.config import get_proxy_config
 from .errors import ProxyError
@@ -34,6 +36,13 @@ class ProxyServer:
         self.message_router = MessageRouter()
         self.core_process = None
         self.core_connection_id = None
+        # Monotonic source of unique request IDs for messages sent to the Core
+        self._request_ids = itertools.count(1)
+        # action -> handler for messages received over the WebSocket
+        self._dispatch: dict[str, Callable[[dict], Awaitable[dict]]] = {
+            "execute_tool": self._handle_execute_tool,
+            "health_check": self._handle_health_check,
+        }
 
         # Register routes
         self._register_routes()
@@ -46,8 +55,8 @@ class ProxyServer:
         async def websocket_endpoint(websocket: WebSocket) -> None:
             await self._handle_websocket(websocket)
 
-        # Health check endpoint
-        @self.app.get("/health")
+        # Health check endpoint, serialized with orjson as it is polled often
+        @self.app.get("/health", response_class=ORJSONResponse)
         async def health_check() -> dict[str, Any]:
             health_status = await check_health()
             if not health_status.get("healthy", False):
@@ -111,23 +120,41 @@ class ProxyServer:
         if "action" not in message:
             raise ProxyError("Missing 'action' field in message")
 
-        action = message.get("action")
-
-        if action == "execute_tool":
-            # Execute tool
-            tool_name = message.get("tool_name")
-            if not tool_name:
-                raise ProxyError("Missing 'tool_name' field for execute_tool action")
-
-            parameters = message.get("parameters", {})
-            return await self._execute_tool(tool_name, parameters)
-        elif action == "health_check":
-            # Health check
-            return await check_health()
-        else:
-            # Unknown action
+        action = message["action"]
+        # Non-string actions (possibly unhashable JSON values) are never valid
+        handler = self._dispatch.get(action) if isinstance(action, str) else None
+        if handler is None:
             raise ProxyError(f"Unknown action: {action}")
 
+        return await handler(message)
+
+    async def _handle_execute_tool(self, message: dict) -> dict:
+        """Handle an execute_tool message.
+
+        Args:
+            message: Message data
+
+        Returns:
+            Dict: Tool execution result
+        """
+        tool_name = message.get("tool_name")
+        if not tool_name:
+            raise ProxyError("Missing 'tool_name' field for execute_tool action")
+
+        parameters = message.get("parameters", {})
+        return await self._execute_tool(tool_name, parameters)
+
+    async def _handle_health_check(self, _message: dict) -> dict:
+        """Handle a health_check message.
+
+        Args:
+            _message: Message data (unused; kept for the handler signature)
+
+        Returns:
+            Dict: Health check result
+        """
+        return await check_health()
+
     async def _execute_tool(self, tool_name: str, parameters: dict) -> dict:
         """Execute a tool.
 
@@ -146,7 +173,7 @@ class ProxyServer:
             "action": "execute_tool",
             "tool_name": tool_name,
             "parameters": parameters,
-            "request_id": str(asyncio.get_event_loop().time()),
+            "request_id": format(next(self._request_ids), "x"),
         }
 
         # Send the message to the Core layer via the router
@@ -23,6 +23,9 @@ class MessageRouter:
         """Initialize the router."""
         self.connections: dict[str, asyncio.Queue] = {}
         self.subscriptions: dict[str, set[str]] = {}
+        # topic -> topic subscribers plus broadcast subscribers; rebuilt lazily
+        # after any subscription change
+        self._effective: dict[str, frozenset[str]] = {}
         self.running = False
         self.router_task = None
 
@@ -40,9 +43,9 @@ class MessageRouter:
             self.router_task.cancel()
 
         # Clear all queues
-        for _, queue in self.connections.items():
+        for queue in self.connections.values():
             # Add a sentinel to unblock any consumers
-            await queue.put(None)
+            queue.put_nowait(None)
 
         logger.info("Message router stopped")
 
@@ -67,10 +70,11 @@ class MessageRouter:
             # Remove from all subscriptions
             for _, subscribers in self.subscriptions.items():
                 subscribers.discard(connection_id)
+            self._effective.clear()
 
             # Remove the connection
             queue = self.connections.pop(connection_id)
-            await queue.put(None)  # Add sentinel to unblock consumers
+            queue.put_nowait(None)  # Add sentinel to unblock consumers
 
             logger.debug(f"Closed connection: {connection_id}")
 
@@ -88,6 +92,7 @@ class MessageRouter:
             self.subscriptions[topic] = set()
 
         self.subscriptions[topic].add(connection_id)
+        self._effective.clear()
         logger.debug(f"Connection {connection_id} subscribed to topic: {topic}")
 
     async def unsubscribe(self, connection_id: str, topic: str) -> None:
@@ -99,6 +104,7 @@ class MessageRouter:
         """
         if topic in self.subscriptions:
             self.subscriptions[topic].discard(connection_id)
+            self._effective.clear()
             logger.debug(f"Connection {connection_id} unsubscribed from topic: {topic}")
 
     async def route_message(self, message: dict, source_id: str | None = None) -> None:
@@ -109,23 +115,33 @@ class MessageRouter:
             source_id: Optional source connection ID to exclude from routing
         """
         topic = message.get("topic", "broadcast")
-        subscribers = self.subscriptions.get(topic, set())
-
-        # Also include broadcast subscribers if this is not a broadcast topic
-        if topic != "broadcast":
-            subscribers = subscribers.union(self.subscriptions.get("broadcast", set()))
+        # A topic nobody subscribed to only reaches broadcast subscribers, so it
+        # shares the "broadcast" entry; the cache never outgrows subscriptions
+        key = topic if topic in self.subscriptions else "broadcast"
+        subscribers = self._effective.get(key)
+        if subscribers is None:
+            # Topic subscribers plus broadcast subscribers, cached until the
+            # next subscription change
+            subscribers = frozenset(self.subscriptions.get(key, ())).union(
+                self.subscriptions.get("broadcast", ())
+            )
+            self._effective[key] = subscribers
 
         logger.debug(
-            f"Routing message to {len(subscribers)} subscribers for topic: {topic}"
+            "Routing message to %d subscribers for topic: %s", len(subscribers), topic
         )
 
+        # Queues are unbounded, so put_nowait never blocks; this hands the
+        # message to every subscriber without a coroutine per delivery
+        connections = self.connections
         for connection_id in subscribers:
             # Skip the source connection to avoid echo
             if connection_id == source_id:
                 continue
 
-            if connection_id in self.connections:
-                await self.connections[connection_id].put(message)
+            queue = connections.get(connection_id)
+            if queue is not None:
+                queue.put_nowait(message)
 
     async def get_message(
         self, connection_id: str, timeout: float | None = None
@@ -0,0 +1,99 @@
+"""Unit tests for the CircuitBreaker."""
+
+import pytest
+
+from chemist_server.mcp_core.adapters import circuit_breaker
+from chemist_server.mcp_core.adapters.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+)
+from chemist_server.mcp_core.errors import CircuitBreakerError
+
+# --- Helpers ---
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _fail() -> str:
+    raise RuntimeError("boom")
+
+
+def _ok_later():
+    # Plain callable that hands back a coroutine, like functools.partial(_ok)
+    return _ok()
+
+
+# --- Test Cases ---
+
+
+async def test_execute_awaits_returned_awaitables():
+    """Test that sync, async and awaitable-returning callables all resolve."""
+    breaker = CircuitBreaker("test")
+
+    assert await breaker.execute(_ok) == "ok"
+    assert await breaker.execute(_ok_later) == "ok"
+    assert await breaker.execute(lambda: "sync") == "sync"
+
+
+async def test_success_resets_failure_count():
+    """Test that only consecutive failures count towards the threshold."""
+    breaker = CircuitBreaker("test", failure_threshold=2)
+
+    with pytest.raises(CircuitBreakerError):
+        await breaker.execute(_fail)
+    assert breaker.failure_count == 1
+
+    assert await breaker.execute(_ok) == "ok"
+    assert breaker.failure_count == 0
+
+    with pytest.raises(CircuitBreakerError):
+        await breaker.execute(_fail)
+    assert breaker.state is CircuitState.CLOSED
+
+
+async def test_open_circuit_fails_fast():
+    """Test that an open circuit rejects calls without invoking the function."""
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=60.0)
+
+    with pytest.raises(CircuitBreakerError):
+        await breaker.execute(_fail)
+    assert breaker.state is CircuitState.OPEN
+
+    calls = []
+
+    async def _tracked() -> str:
+        calls.append(1)
+        return "ok"
+
+    with pytest.raises(CircuitBreakerError, match="is open"):
+        await breaker.execute(_tracked)
+    assert calls == []
+
+
+@pytest.mark.parametrize(("draw", "expected"), [(0.0, 10.0), (1.0, 15.0)])
+async def test_recovery_window_is_jittered_above_timeout(
+    monkeypatch: pytest.MonkeyPatch, draw: float, expected: float
+):
+    """Test that jitter only lengthens the wait beyond recovery_timeout."""
+    monkeypatch.setattr(circuit_breaker.random, "random", lambda: draw)
+    breaker = CircuitBreaker(
+        "test", failure_threshold=1, recovery_timeout=10.0, recovery_jitter=0.5
+    )
+
+    with pytest.raises(CircuitBreakerError):
+        await breaker.execute(_fail)
+
+    assert breaker._recovery_delay == pytest.approx(expected)
+
+
+async def test_recovery_window_defaults_to_timeout(monkeypatch: pytest.MonkeyPatch):
+    """Test that without jitter the wait is exactly recovery_timeout."""
+    monkeypatch.setattr(circuit_breaker.random, "random", lambda: 1.0)
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10.0)
+
+    with pytest.raises(CircuitBreakerError):
+        await breaker.execute(_fail)
+
+    assert breaker._recovery_delay == 10.0
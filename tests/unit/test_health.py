@@ -1,9 +1,12 @@
 """Unit tests for the health check system."""
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from chemist_server.mcp_core.health import HealthCheck, HealthStatus
+from chemist_server.mcp_core.health import HealthCheck, HealthStatus, SystemHealth
 
 pytestmark = pytest.mark.asyncio
 
@@ -60,6 +63,108 @@ class TestHealthCheck:
         assert result["timestamp"] == 1234567890
 
 
+class SlowHealthCheck(HealthCheck):
+    """Health check that takes a fixed time, optionally failing."""
+
+    def __init__(self, delay=0.05, error=None):
+        self.delay = delay
+        self.error = error
+
+    async def check_health(self):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return {"status": HealthStatus.HEALTHY}
+
+
+class TestSystemHealth:
+    """Tests for the SystemHealth aggregator."""
+
+    async def test_components_checked_concurrently(self):
+        """Test that component checks overlap instead of running back to back."""
+        system = SystemHealth([SlowHealthCheck(0.1) for _ in range(5)])
+
+        start = time.monotonic()
+        result = await system.check_health()
+
+        assert time.monotonic() - start < 0.3
+        assert result["status"] == HealthStatus.HEALTHY
+
+    async def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrent checks run at once."""
+        in_flight = 0
+        peak = 0
+
+        class CountingCheck(HealthCheck):
+            async def check_health(self):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"status": HealthStatus.HEALTHY}
+
+        system = SystemHealth([CountingCheck() for _ in range(10)], max_concurrent=3)
+        await system.check_health()
+
+        assert peak == 3
+
+    async def test_result_cached_within_ttl(self):
+        """Test that repeated probes within the TTL reuse one check."""
+        component = MockHealthCheck()
+        component.check_health = AsyncMock(
+            return_value={"status": HealthStatus.HEALTHY}
+        )
+        system = SystemHealth([component], cache_ttl=60.0)
+
+        await asyncio.gather(*(system.check_health() for _ in range(5)))
+        await system.check_health()
+        assert component.check_health.await_count == 1
+
+        await system.check_health(use_cache=False)
+        assert component.check_health.await_count == 2
+
+    async def test_cached_result_is_isolated_from_callers(self):
+        """Test that changing a returned report does not alter the cache."""
+        component = MockHealthCheck()
+        component.check_health = AsyncMock(
+            return_value={"status": HealthStatus.HEALTHY, "details": {"db": "up"}}
+        )
+        system = SystemHealth([component], cache_ttl=60.0)
+
+        fresh = await system.check_health()
+        fresh["components"].pop("MockHealthCheck")
+        hit = await system.check_health()
+        hit["components"]["MockHealthCheck"]["details"]["db"] = "down"
+        again = await system.check_health()
+
+        assert component.check_health.await_count == 1
+        assert again["components"]["MockHealthCheck"]["details"] == {"db": "up"}
+
+    async def test_concurrent_callers_share_one_refresh(self):
+        """Test that probes arriving during a refresh await the same result."""
+        component = SlowHealthCheck(0.05)
+        component.check_health = AsyncMock(wraps=component.check_health)
+        system = SystemHealth([component], cache_ttl=0.0)
+
+        results = await asyncio.gather(*(system.check_health() for _ in range(5)))
+
+        assert component.check_health.await_count == 1
+        assert all(r == results[0] for r in results)
+
+        results[0]["components"].clear()
+        assert all(r["components"] for r in results[1:])
+
+    async def test_failing_component_marks_system_unhealthy(self):
+        """Test that a raising component is reported as unhealthy."""
+        system = SystemHealth([SlowHealthCheck(error=RuntimeError("down"))])
+
+        result = await system.check_health()
+
+        assert result["status"] == HealthStatus.UNHEALTHY
+        assert result["components"]["SlowHealthCheck"]["error"] == "down"
+
+
 # Create a minimal HealthRegistry class for testing if not available in the module
 class HealthRegistry:
     """Health registry for testing purposes."""
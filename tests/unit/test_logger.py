@@ -2,6 +2,7 @@
 
 import json
 import logging
+import queue
 import sys
 import time
 from datetime import datetime
@@ -22,6 +23,7 @@ from chemist_server.mcp_core.logger.logger import (
     _global_logs_path,
     _is_logging_configured,
     _log_handlers,
+    _QueuedRotatingFileHandler,
     configure_logging,
     get_log_dir,
 )
@@ -283,3 +285,32 @@ def test_get_log_dir(tmp_path: Path):
 
     assert get_log_dir(base_path, "other_service") == base_path / "misc"
     assert (base_path / "misc").is_dir()
+
+
+def test_queued_handler_snapshots_record_on_caller(tmp_path: Path):
+    """Test that values mutated after logging do not reach the log file."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    log_file = tmp_path / "queued.log"
+    handler = _QueuedRotatingFileHandler(
+        log_file, maxBytes=1024 * 1024, log_queue=log_queue
+    )
+    handler.setFormatter(JsonFormatter())
+
+    items = ["a"]
+    payload = {"state": "before"}
+    record = logging.makeLogRecord(
+        {"msg": "items=%s", "args": (items,), "payload": payload}
+    )
+    handler.handle(record)
+
+    # Mutate after logging but before the listener writes the line
+    items.append("b")
+    payload["state"] = "after"
+    while not log_queue.empty():
+        target, line = log_queue.get_nowait()
+        target.write_record(line)
+    handler.close()
+
+    logged = json.loads(log_file.read_text().strip())
+    assert logged["message"] == "items=['a']"
+    assert logged["payload"] == {"state": "before"}
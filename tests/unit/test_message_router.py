@@ -0,0 +1,102 @@
+"""Unit tests for the proxy MessageRouter."""
+
+from chemist_server.mcp_proxy.router import MessageRouter
+
+# --- Helpers ---
+
+
+async def _drain(router: MessageRouter, connection_id: str) -> list[dict]:
+    """Return every message currently queued for a connection."""
+    queue = router.connections[connection_id]
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+# --- Test Cases ---
+
+
+async def test_route_message_reaches_topic_and_broadcast_subscribers():
+    """Test that a topic message reaches its subscribers and broadcast ones."""
+    router = MessageRouter()
+    topic_conn = await router.create_connection()
+    broadcast_conn = await router.create_connection()
+    other_conn = await router.create_connection()
+    await router.subscribe(topic_conn, "tools")
+    await router.subscribe(broadcast_conn, "broadcast")
+    await router.subscribe(other_conn, "logs")
+
+    message = {"topic": "tools", "data": 1}
+    await router.route_message(message)
+
+    assert await _drain(router, topic_conn) == [message]
+    assert await _drain(router, broadcast_conn) == [message]
+    assert await _drain(router, other_conn) == []
+
+
+async def test_route_message_skips_source():
+    """Test that the source connection does not receive its own message."""
+    router = MessageRouter()
+    source = await router.create_connection()
+    await router.subscribe(source, "broadcast")
+
+    await router.route_message({"data": 1}, source_id=source)
+
+    assert await _drain(router, source) == []
+
+
+async def test_unknown_topics_are_not_cached():
+    """Test that unsubscribed topics fall back to broadcast without growing the cache."""
+    router = MessageRouter()
+    conn = await router.create_connection()
+    await router.subscribe(conn, "broadcast")
+
+    for i in range(100):
+        await router.route_message({"topic": f"ephemeral-{i}"})
+
+    assert len(await _drain(router, conn)) == 100
+    assert set(router._effective) == {"broadcast"}
+
+
+async def test_subscribe_invalidates_cached_subscribers():
+    """Test that a new subscription is seen by the next routed message."""
+    router = MessageRouter()
+    first = await router.create_connection()
+    second = await router.create_connection()
+    await router.subscribe(first, "tools")
+    await router.route_message({"topic": "tools"})
+
+    await router.subscribe(second, "tools")
+    await router.route_message({"topic": "tools"})
+
+    assert len(await _drain(router, first)) == 2
+    assert len(await _drain(router, second)) == 1
+
+
+async def test_unsubscribe_invalidates_cached_subscribers():
+    """Test that an unsubscribed connection stops receiving the topic."""
+    router = MessageRouter()
+    conn = await router.create_connection()
+    await router.subscribe(conn, "tools")
+    await router.route_message({"topic": "tools"})
+
+    await router.unsubscribe(conn, "tools")
+    await router.route_message({"topic": "tools"})
+
+    assert len(await _drain(router, conn)) == 1
+
+
+async def test_close_connection_invalidates_cached_subscribers():
+    """Test that a closed connection is dropped from cached subscriber sets."""
+    router = MessageRouter()
+    conn = await router.create_connection()
+    await router.subscribe(conn, "tools")
+    await router.route_message({"topic": "tools"})
+    assert router._effective
+
+    await router.close_connection(conn)
+    await router.route_message({"topic": "tools"})
+
+    assert router._effective["tools"] == frozenset()
+    assert conn not in router.connections
@@ -0,0 +1,87 @@
+"""Unit tests for the metrics collectors."""
+
+import pytest
+
+from chemist_server.mcp_core.metrics.collectors import (
+    BatchingHistogram,
+    Histogram,
+    RequestMetricsCollector,
+)
+
+# --- Test Cases ---
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that each bucket counts every observation at or below its bound."""
+    histogram = Histogram("latency", "Latency", buckets=[0.1, 1.0, 0.5])
+
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0):
+        histogram.observe(value)
+
+    assert histogram.bucket_values == {
+        0.1: 2,
+        0.5: 3,
+        1.0: 4,
+        float("inf"): 5,
+    }
+    assert histogram.count == 5
+    assert histogram.sum == pytest.approx(3.15)
+
+
+def test_histogram_default_buckets():
+    """Test that the default buckets end with the +Inf bucket."""
+    histogram = Histogram("latency", "Latency")
+    histogram.observe(100)
+
+    values = histogram.bucket_values
+    assert list(values)[-1] == float("inf")
+    assert values[float("inf")] == 1
+    assert values[10] == 0
+
+
+def test_batching_histogram_defers_until_read():
+    """Test that buffered observations are applied when the buckets are read."""
+    histogram = BatchingHistogram("latency", "Latency", buckets=[0.1, 1.0])
+
+    for value in (0.05, 0.5, 2.0):
+        histogram.observe(value)
+    assert len(histogram._pending) == 3
+
+    assert histogram.bucket_values == {0.1: 1, 1.0: 2, float("inf"): 3}
+    assert len(histogram._pending) == 0
+
+
+def test_batching_histogram_totals_are_never_stale():
+    """Test that sum and count include observations still in the buffer."""
+    histogram = BatchingHistogram("latency", "Latency", buckets=[1.0])
+
+    for value in (0.25, 0.5):
+        histogram.observe(value)
+
+    assert len(histogram._pending) == 2
+    assert histogram.sum == pytest.approx(0.75)
+    assert histogram.count == 2
+
+
+def test_batching_histogram_flushes_when_full():
+    """Test that reaching max_pending buckets the buffer inline."""
+    histogram = BatchingHistogram("latency", "Latency", buckets=[1.0], max_pending=2)
+
+    histogram.observe(0.5)
+    assert len(histogram._pending) == 1
+    histogram.observe(0.5)
+    assert len(histogram._pending) == 0
+    assert histogram._counts == [2, 0]
+
+
+def test_request_collector_records_duration():
+    """Test that request durations reach the histogram once it is read."""
+    collector = RequestMetricsCollector()
+
+    start = collector.record_request_start()
+    duration = collector.record_request_end(start, success=False)
+
+    assert duration >= 0
+    assert collector.request_duration.bucket_values[float("inf")] == 1
+    assert collector.request_error_count.value == 1
+    assert collector.request_active.value == 0
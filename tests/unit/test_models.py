@@ -0,0 +1,49 @@
+"""Unit tests for the request and response models."""
+
+import pytest
+from pydantic import ValidationError
+
+from chemist_server.mcp_core.models import (
+    CoreRequest,
+    CoreResponse,
+    RequestContext,
+    set_correlation_id_factory,
+)
+
+# --- Test Cases ---
+
+
+@pytest.mark.parametrize("timeout", [0, -1.5])
+def test_request_rejects_non_positive_timeout(timeout: float):
+    """Test that a timeout must be strictly positive."""
+    with pytest.raises(ValidationError, match="greater than 0"):
+        CoreRequest(tool_name="tool", timeout=timeout)
+
+
+def test_request_accepts_positive_or_missing_timeout():
+    """Test that a positive timeout or no timeout is accepted."""
+    assert CoreRequest(tool_name="tool", timeout=2.5).timeout == 2.5
+    assert CoreRequest(tool_name="tool").timeout is None
+
+
+def test_correlation_id_factory_can_be_overridden():
+    """Test that the correlation ID factory can be swapped and restored."""
+    default_id = RequestContext().correlation_id
+    assert len(default_id) == 32
+    assert "-" not in default_id
+
+    set_correlation_id_factory(lambda: "trace-123")
+    try:
+        assert RequestContext().correlation_id == "trace-123"
+    finally:
+        set_correlation_id_factory(None)
+
+    assert RequestContext().correlation_id != "trace-123"
+
+
+def test_from_error_builds_unvalidated_models():
+    """Test that the trusted error constructor populates every field."""
+    error = CoreResponse.from_error(RuntimeError("boom"), correlation_id="cid")
+    assert error.success is False
+    assert error.error.code == "INTERNAL_ERROR"
+    assert error.error.details == {"exception_type": "RuntimeError"}
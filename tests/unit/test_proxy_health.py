@@ -0,0 +1,60 @@
+"""Unit tests for the proxy health report."""
+
+import asyncio
+
+from chemist_server.mcp_proxy import health
+
+# --- Helpers ---
+
+
+def _concurrent_check(started: list[str], all_started: asyncio.Event, name: str):
+    """Build a check that only completes once every check has started."""
+
+    async def check() -> dict:
+        started.append(name)
+        if len(started) == 3:
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+        return {"healthy": name != "transports", "name": name}
+
+    return check
+
+
+# --- Test Cases ---
+
+
+async def test_check_health_runs_checks_concurrently(monkeypatch):
+    """Test that all checks overlap and land under their keys in the report."""
+    started: list[str] = []
+    all_started = asyncio.Event()
+    for attr, name in (
+        ("check_system_health", "system"),
+        ("check_core_connectivity", "core_connectivity"),
+        ("check_transport_health", "transports"),
+    ):
+        monkeypatch.setattr(health, attr, _concurrent_check(started, all_started, name))
+
+    report = await health.check_health()
+
+    assert sorted(started) == ["core_connectivity", "system", "transports"]
+    assert {key: check["name"] for key, check in report["checks"].items()} == {
+        "system": "system",
+        "core_connectivity": "core_connectivity",
+        "transports": "transports",
+    }
+    assert report["healthy"] is False
+    assert report["service"] == "mcp_proxy"
+    assert report["version"] == "1.0.0"
+    assert report["response_time"] >= 0
+
+
+async def test_check_health_does_not_mutate_template():
+    """Test that each report is built from a fresh copy of the template."""
+    first = await health.check_health()
+    second = await health.check_health()
+
+    assert first is not second
+    assert health._HEALTH_TEMPLATE["checks"] == {}
+    assert health._HEALTH_TEMPLATE["timestamp"] == 0.0
+    assert set(first["checks"]) == {"system", "core_connectivity", "transports"}
+    assert first["checks"]["system"]["cpu_count"] is not None
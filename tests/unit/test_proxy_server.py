@@ -0,0 +1,97 @@
+"""Unit tests for the proxy server message handling and routes."""
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from chemist_server.mcp_proxy import proxy_server
+from chemist_server.mcp_proxy.errors import ProxyError
+from chemist_server.mcp_proxy.proxy_server import ProxyServer
+
+# --- Helpers ---
+
+
+@pytest.fixture
+def server() -> ProxyServer:
+    """Build a proxy server on a fresh FastAPI app."""
+    return ProxyServer(FastAPI())
+
+
+async def _fake_health(healthy: bool) -> dict:
+    return {"service": "mcp_proxy", "healthy": healthy, "checks": {}}
+
+
+# --- Test Cases ---
+
+
+@pytest.mark.parametrize(
+    ("message", "error"),
+    [
+        ({}, "Missing 'action'"),
+        ({"action": "reboot"}, "Unknown action: reboot"),
+        ({"action": 5}, "Unknown action: 5"),
+        ({"action": ["execute_tool"]}, "Unknown action"),
+        ({"action": {"name": "health_check"}}, "Unknown action"),
+    ],
+    ids=["missing", "unknown", "int", "list", "dict"],
+)
+async def test_process_message_rejects_invalid_actions(server, message, error):
+    """Test that missing, unknown and non-string actions raise ProxyError."""
+    with pytest.raises(ProxyError, match=error):
+        await server._process_message(message)
+
+
+async def test_execute_tool_requires_tool_name(server):
+    """Test that execute_tool without a tool_name raises ProxyError."""
+    with pytest.raises(ProxyError, match="Missing 'tool_name'"):
+        await server._process_message({"action": "execute_tool"})
+
+
+async def test_health_check_action_dispatches(server, monkeypatch):
+    """Test that the health_check action returns the health report."""
+    monkeypatch.setattr(proxy_server, "check_health", lambda: _fake_health(True))
+
+    result = await server._process_message({"action": "health_check"})
+
+    assert result["healthy"] is True
+
+
+async def test_core_request_ids_are_unique_hex(server):
+    """Test that each message sent to the Core gets a new hex request ID."""
+    server.core_connection_id = "core"
+    router = server.message_router
+    listener = await router.create_connection()
+    await router.subscribe(listener, "broadcast")
+
+    for _ in range(20):
+        await server._process_message(
+            {"action": "execute_tool", "tool_name": "echo", "parameters": {}}
+        )
+
+    queue = router.connections[listener]
+    request_ids = [queue.get_nowait()["request_id"] for _ in range(20)]
+    assert request_ids == [format(i, "x") for i in range(1, 21)]
+    assert len(set(request_ids)) == 20
+
+
+@pytest.mark.parametrize(("healthy", "status"), [(True, 200), (False, 503)])
+def test_health_route_uses_orjson(server, monkeypatch, healthy, status):
+    """Test that /health is served by ORJSONResponse with the right status."""
+    monkeypatch.setattr(proxy_server, "check_health", lambda: _fake_health(healthy))
+    route = next(r for r in server.app.routes if getattr(r, "path", "") == "/health")
+
+    response = TestClient(server.app).get("/health")
+
+    assert route.response_class is ORJSONResponse
+    assert response.status_code == status
+    assert response.headers["content-type"] == "application/json"
+    if healthy:
+        assert response.json() == {
+            "service": "mcp_proxy",
+            "healthy": True,
+            "checks": {},
+        }
@@ -0,0 +1,277 @@
+"""Unit tests for the PythonAdapter."""
+
+import asyncio
+import re
+import threading
+
+import pytest
+
+from chemist_server.mcp_core.adapters.python_adapter import PythonAdapter
+from chemist_server.mcp_core.errors import AdapterError
+
+# --- Helpers ---
+
+
+def _make_adapter(function, **kwargs) -> PythonAdapter:
+    """Build an adapter around an in-test function without importing a module."""
+    adapter = PythonAdapter("json", function.__name__, load_module=False, **kwargs)
+    adapter.function = function
+    return adapter
+
+
+# --- Test Cases ---
+
+
+async def test_coalesced_calls_share_one_execution():
+    """Test that concurrent identical coalesced calls run the function once."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def lookup(name):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"name": name, "tags": ["a"]}
+
+    adapter = _make_adapter(lookup)
+    context = {"coalesce": True}
+    first = asyncio.ensure_future(adapter.execute("lookup", {"name": "x"}, context))
+    second = asyncio.ensure_future(adapter.execute("lookup", {"name": "x"}, context))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(first, second)
+
+    assert calls == 1
+    assert results[0] == results[1] == {"name": "x", "tags": ["a"]}
+    assert adapter._inflight == {}
+
+
+async def test_coalesced_callers_get_independent_results():
+    """Test that mutating one caller's result does not leak into another's."""
+    release = asyncio.Event()
+
+    async def lookup():
+        await release.wait()
+        return {"status": "ok"}
+
+    adapter = _make_adapter(lookup)
+    context = {"coalesce": True}
+    first = asyncio.ensure_future(adapter.execute("lookup", {}, context))
+    second = asyncio.ensure_future(adapter.execute("lookup", {}, context))
+    await asyncio.sleep(0)
+    release.set()
+    a, b = await asyncio.gather(first, second)
+    a["status"] = "mutated"
+
+    assert b == {"status": "ok"}
+
+
+async def test_coalescing_is_keyed_on_deadline():
+    """Test that calls with different deadlines do not share an execution."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def lookup():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {}
+
+    adapter = _make_adapter(lookup)
+    first = asyncio.ensure_future(
+        adapter.execute("lookup", {}, {"coalesce": True, "deadline_s": 5})
+    )
+    second = asyncio.ensure_future(
+        adapter.execute("lookup", {}, {"coalesce": True, "deadline_s": 10})
+    )
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert calls == 2
+
+
+async def test_objects_with_equal_reprs_are_not_merged():
+    """Test that non-JSON parameters run separately even if their reprs match."""
+    release = asyncio.Event()
+
+    class Opaque:
+        def __init__(self, value):
+            self.value = value
+
+        def __repr__(self):
+            return "Opaque()"
+
+    async def read(item):
+        await release.wait()
+        return {"value": item.value}
+
+    adapter = _make_adapter(read)
+    context = {"coalesce": True}
+    first = asyncio.ensure_future(adapter.execute("read", {"item": Opaque(1)}, context))
+    second = asyncio.ensure_future(
+        adapter.execute("read", {"item": Opaque(2)}, context)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, second) == [{"value": 1}, {"value": 2}]
+    assert adapter._inflight == {}
+
+
+async def test_unserialisable_parameters_skip_coalescing():
+    """Test that parameters json cannot sort are executed without coalescing."""
+
+    async def echo(data):
+        return {"data": data}
+
+    adapter = _make_adapter(echo)
+    mixed = {1: "int key", "a": "str key"}
+
+    result = await adapter.execute("echo", {"data": mixed}, {"coalesce": True})
+
+    assert result == {"data": mixed}
+    assert adapter._inflight == {}
+
+
+async def test_sync_calls_reuse_one_executor():
+    """Test that synchronous functions share the adapter's persistent pool."""
+    threads = []
+
+    def record():
+        threads.append(threading.current_thread().name)
+        return "done"
+
+    adapter = _make_adapter(record, max_workers=1)
+
+    assert await adapter.execute("record", {}) == {"result": "done"}
+    executor = adapter._executor
+    await adapter.execute("record", {})
+
+    assert adapter._executor is executor
+    assert threads[0] == threads[1]
+    assert threads[0].startswith("py-adapter-record")
+
+    await adapter.shutdown()
+    assert adapter._executor is None
+
+
+async def test_bulkhead_bounds_concurrent_executions():
+    """Test that no more than max_concurrency calls run at once."""
+    running = 0
+    peak = 0
+
+    async def work():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {}
+
+    adapter = _make_adapter(work, max_concurrency=2)
+
+    await asyncio.gather(*(adapter.execute("work", {}) for _ in range(6)))
+
+    assert peak == 2
+    assert adapter._bulkhead._value == 2
+
+
+async def test_deadline_exceeded_raises_adapter_error():
+    """Test that an expired deadline is reported with its details."""
+
+    async def slow():
+        await asyncio.sleep(1)
+
+    adapter = _make_adapter(slow, timeout=1)
+
+    with pytest.raises(
+        AdapterError, match=re.escape("Deadline of 0.01s exceeded")
+    ) as exc:
+        await adapter.execute("slow", {}, {"deadline_s": 0.01})
+
+    assert exc.value.details == {"tool": "slow", "deadline_s": 0.01}
+    assert adapter._bulkhead._value == adapter.max_concurrency
+
+
+async def test_timeout_raised_by_function_is_not_a_deadline():
+    """Test that a TimeoutError from the tool itself is a plain execution error."""
+
+    async def flaky():
+        raise TimeoutError("upstream timed out")
+
+    adapter = _make_adapter(flaky, timeout=5)
+
+    with pytest.raises(AdapterError, match="Error executing flaky") as exc:
+        await adapter.execute("flaky", {})
+
+    assert "Deadline" not in str(exc.value)
+
+
+async def test_timed_out_sync_call_keeps_its_slot_until_done():
+    """Test that a worker still running after a deadline holds its slot."""
+    release = threading.Event()
+    calls = 0
+
+    def block():
+        nonlocal calls
+        calls += 1
+        # Only the first call blocks; later ones would finish instantly
+        if calls == 1:
+            release.wait(5)
+        return "finished"
+
+    adapter = _make_adapter(block, max_concurrency=1, max_workers=2)
+
+    with pytest.raises(AdapterError, match="Deadline"):
+        await adapter.execute("block", {}, {"deadline_s": 0.05})
+    # The first worker is still running, so the only slot is still taken
+    with pytest.raises(AdapterError, match="Deadline"):
+        await adapter.execute("block", {}, {"deadline_s": 0.05})
+    assert calls == 1
+
+    release.set()
+    assert await adapter.execute("block", {}, {"deadline_s": 5}) == {
+        "result": "finished"
+    }
+    await adapter.shutdown()
+
+
+async def test_health_check_is_cached_and_returns_copies():
+    """Test that cached health results are reused but never shared."""
+    adapter = PythonAdapter("json", "dumps", health_ttl=60)
+
+    first = await adapter.health_check()
+    first["status"] = "mutated"
+    second = await adapter.health_check()
+
+    assert second["status"] == "healthy"
+    assert adapter._health_cache[1]["status"] == "healthy"
+
+
+async def test_unhealthy_result_is_cached_until_bypassed():
+    """Test the unhealthy TTL and that use_cache=False forces a fresh check."""
+    adapter = PythonAdapter("chemist_server_missing_module", "run", load_module=False)
+
+    assert (await adapter.health_check())["status"] == "unhealthy"
+    adapter.module_path = "json"
+    adapter.function_name = "dumps"
+
+    assert (await adapter.health_check())["status"] == "unhealthy"
+    assert (await adapter.health_check(use_cache=False))["status"] == "healthy"
+
+
+async def test_health_cache_expires_after_ttl():
+    """Test that a result older than its TTL is recomputed."""
+    adapter = PythonAdapter(
+        "chemist_server_missing_module",
+        "run",
+        load_module=False,
+        unhealthy_health_ttl=0,
+    )
+
+    assert (await adapter.health_check())["status"] == "unhealthy"
+    adapter.module_path = "json"
+    adapter.function_name = "dumps"
+
+    assert (await adapter.health_check())["status"] == "healthy"
@@ -1,6 +1,8 @@
 """Unit tests for the ToolRegistry."""
 
-from unittest.mock import MagicMock
+import asyncio
+import re
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -8,7 +10,12 @@ import pytest
 from chemist_server.mcp_core.adapters.base_adapter import BaseAdapter
 from chemist_server.mcp_core.adapters.circuit_breaker import CircuitBreaker
 from chemist_server.mcp_core.errors import AdapterError
-from chemist_server.mcp_core.registry import ToolMetadata, ToolRegistry
+from chemist_server.mcp_core.registry import (
+    DEFAULT_RECOVERY_JITTER,
+    ToolListEntry,
+    ToolMetadata,
+    ToolRegistry,
+)
 
 # --- Fixtures ---
 
@@ -73,6 +80,18 @@ def test_register_tool_success(registry: ToolRegistry, mock_adapter: MagicMock):
     assert registry.circuit_breakers[circuit_name].failure_threshold == 3
 
 
+def test_register_tool_jitters_circuit_recovery(
+    registry: ToolRegistry, mock_adapter: MagicMock
+):
+    """Test that registered breakers get recovery jitter unless overridden."""
+    registry.register_tool("jittered", mock_adapter, "1.0")
+    registry.register_tool("steady", mock_adapter, "1.0", recovery_jitter=0.0)
+
+    jittered = registry.get_circuit_breaker("jittered")
+    assert jittered.recovery_jitter == DEFAULT_RECOVERY_JITTER > 0
+    assert registry.get_circuit_breaker("steady").recovery_jitter == 0.0
+
+
 def test_register_tool_duplicate_version_raises_error(
     registry: ToolRegistry, mock_adapter: MagicMock
 ):
@@ -210,6 +229,31 @@ def test_list_tools(registry: ToolRegistry, mock_adapter: MagicMock):
     }
 
 
+def test_identical_tag_sets_are_shared(registry: ToolRegistry, mock_adapter: MagicMock):
+    """Test that tools registered with the same tags share one frozenset."""
+    registry.register_tool("tool_a", mock_adapter, "1.0", tags=["x", "y"])
+    registry.register_tool("tool_b", mock_adapter, "1.0", tags=("y", "x"))
+
+    tags_a = registry.get_metadata("tool_a").tags
+    tags_b = registry.get_metadata("tool_b").tags
+    assert tags_a == frozenset({"x", "y"})
+    assert tags_a is tags_b
+
+
+def test_iter_tools(registry: ToolRegistry, mock_adapter: MagicMock):
+    """Test iterating registered tool versions as ToolListEntry tuples."""
+    registry.register_tool("tool_a", mock_adapter, "1.0", description="A v1")
+    registry.register_tool("tool_a", mock_adapter, "1.1", make_latest=False)
+
+    entries = sorted(registry.iter_tools())
+
+    assert entries == [
+        ToolListEntry("tool_a", "1.0", True, "A v1", "MockAdapter"),
+        ToolListEntry("tool_a", "1.1", False, "", "MockAdapter"),
+    ]
+    assert registry.list_tools() == [entry._asdict() for entry in registry.iter_tools()]
+
+
 def test_list_versions(registry: ToolRegistry, mock_adapter: MagicMock):
     """Test listing versions for a specific tool."""
     tool_name = "multi_version_tool"
@@ -253,3 +297,117 @@ def test_get_circuit_breaker_not_found(registry: ToolRegistry):
         AdapterError, match="Circuit breaker not found for cb_exists v2.0"
     ):
         registry.get_circuit_breaker("cb_exists", version="2.0")
+
+
+async def test_execute_tool_uses_registered_adapter(
+    registry: ToolRegistry, mock_adapter: MagicMock
+):
+    """Test that execute_tool dispatches to the adapter of the resolved version."""
+    other_adapter = MagicMock(spec=BaseAdapter)
+    other_adapter.execute = AsyncMock(return_value={"from": "1.0"})
+    mock_adapter.execute = AsyncMock(return_value={"from": "2.0"})
+    registry.register_tool("exec_tool", other_adapter, "1.0")
+    registry.register_tool("exec_tool", mock_adapter, "2.0")
+
+    result = await registry.execute_tool(
+        "exec_tool", {"x": 1}, use_circuit_breaker=False
+    )
+    assert result == {"from": "2.0"}
+    mock_adapter.execute.assert_awaited_once_with("exec_tool", {"x": 1}, None)
+
+    result = await registry.execute_tool(
+        "exec_tool", {}, version="1.0", use_circuit_breaker=False
+    )
+    assert result == {"from": "1.0"}
+
+
+async def test_execute_tool_through_circuit_breaker(
+    registry: ToolRegistry, mock_adapter: MagicMock
+):
+    """Test that the circuit-breaker path returns the adapter result directly."""
+    mock_adapter.execute = AsyncMock(return_value={"ok": True})
+    registry.register_tool("exec_tool", mock_adapter, "1.0")
+
+    result = await registry.execute_tool("exec_tool", {"x": 1})
+
+    assert result == {"ok": True}
+    mock_adapter.execute.assert_awaited_once_with("exec_tool", {"x": 1}, None)
+    assert registry.get_circuit_breaker("exec_tool").failure_count == 0
+
+
+async def test_execute_tool_unknown_version_raises(
+    registry: ToolRegistry, mock_adapter: MagicMock
+):
+    """Test that execute_tool rejects versions that were never registered."""
+    registry.register_tool("exec_tool", mock_adapter, "1.0")
+
+    with pytest.raises(
+        AdapterError, match=re.escape("Version 9.9 not found for tool exec_tool")
+    ):
+        await registry.execute_tool("exec_tool", {}, version="9.9")
+
+
+async def test_execute_tool_follows_explicit_latest(
+    registry: ToolRegistry, mock_adapter: MagicMock
+):
+    """Test that execute_tool without a version honours make_latest=False."""
+    mock_adapter.execute = AsyncMock(return_value={"from": "1.0"})
+    newer_adapter = MagicMock(spec=BaseAdapter)
+    newer_adapter.execute = AsyncMock(return_value={"from": "2.0"})
+    registry.register_tool("exec_tool", mock_adapter, "1.0")
+    registry.register_tool("exec_tool", newer_adapter, "2.0", make_latest=False)
+
+    result = await registry.execute_tool("exec_tool", {}, use_circuit_breaker=False)
+    assert result == {"from": "1.0"}
+    newer_adapter.execute.assert_not_awaited()
+
+    with pytest.raises(AdapterError, match="No versions found for tool missing"):
+        await registry.execute_tool("missing", {})
+
+
+async def test_execute_tool_follows_latest_versions_updates(
+    registry: ToolRegistry, mock_adapter: MagicMock
+):
+    """Test that changing latest_versions directly redirects default execution."""
+    mock_adapter.execute = AsyncMock(return_value={"from": "1.0"})
+    newer_adapter = MagicMock(spec=BaseAdapter)
+    newer_adapter.execute = AsyncMock(return_value={"from": "2.0"})
+    registry.register_tool("exec_tool", mock_adapter, "1.0")
+    registry.register_tool("exec_tool", newer_adapter, "2.0", make_latest=False)
+
+    registry.latest_versions["exec_tool"] = "2.0"
+    result = await registry.execute_tool("exec_tool", {}, use_circuit_breaker=False)
+
+    assert result == {"from": "2.0"}
+
+
+async def test_shutdown_runs_adapters_concurrently(registry: ToolRegistry):
+    """Test that adapters shut down in parallel and failures are collected."""
+    started = []
+    all_started = asyncio.Event()
+    release = asyncio.Event()
+
+    def _adapter(name: str, fail: bool = False) -> MagicMock:
+        async def _shutdown() -> None:
+            started.append(name)
+            if len(started) == 2:
+                all_started.set()
+            await release.wait()
+            if fail:
+                raise RuntimeError(f"{name} failed")
+
+        adapter = MagicMock(spec=BaseAdapter)
+        adapter.shutdown = _shutdown
+        return adapter
+
+    registry.register_tool("tool_a", _adapter("a"), "1.0")
+    registry.register_tool("tool_b", _adapter("b", fail=True), "2.0")
+
+    shutdown = asyncio.create_task(registry.shutdown())
+    # Both shutdowns must be in flight before either is allowed to finish
+    await asyncio.wait_for(all_started.wait(), timeout=1.0)
+    assert sorted(started) == ["a", "b"]
+
+    release.set()
+    with pytest.raises(AdapterError, match=re.escape("tool_b v2.0: b failed")):
+        await shutdown
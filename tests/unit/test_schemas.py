@@ -0,0 +1,137 @@
+"""Unit tests for tool schema registration and validation."""
+
+import importlib
+import sys
+
+import pytest
+
+import chemist_server.mcp_core as mcp_core
+from chemist_server.mcp_core.errors import ValidationError
+
+_VALIDATION_MODULES = (
+    "chemist_server.mcp_core.validation",
+    "chemist_server.mcp_core.validation.schemas",
+    "chemist_server.mcp_core.validation.validators",
+)
+
+# --- Helpers ---
+
+
+@pytest.fixture
+def validation(monkeypatch):
+    """Import a fresh copy of the real validation package.
+
+    conftest replaces the package with a mock in sys.modules; this swaps the
+    real one in for the test, with empty registries, and restores the mock.
+    """
+    for name in _VALIDATION_MODULES:
+        # setitem records the original entry (or its absence) for teardown
+        monkeypatch.setitem(sys.modules, name, None)
+        monkeypatch.delitem(sys.modules, name)
+    monkeypatch.setattr(mcp_core, "validation", None, raising=False)
+    return importlib.import_module("chemist_server.mcp_core.validation")
+
+
+def _schema_dict(version: str = "1.0.0") -> dict:
+    """Build a tool schema dict with one required integer parameter."""
+    return {
+        "name": "repeat",
+        "version": version,
+        "description": "Repeat a message",
+        "parameters": [
+            {
+                "name": "count",
+                "type": "integer",
+                "description": "Times to repeat",
+                "required": True,
+                "min_value": 1,
+                "max_value": 10,
+            }
+        ],
+        "required_parameters": ["count"],
+    }
+
+
+# --- Test Cases ---
+
+
+def test_from_dict_builds_nested_parameter_schemas(validation):
+    """Test that parameter dicts become ParameterSchema instances."""
+    schema = validation.ToolSchema.from_dict(_schema_dict())
+
+    assert schema.parameters[0].name == "count"
+    assert schema.parameters[0].to_json_schema()["maximum"] == 10.0
+    assert schema.required_parameters == ["count"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {k: v for k, v in _schema_dict().items() if k != "parameters"},
+        {**_schema_dict(), "unexpected": True},
+        {**_schema_dict(), "parameters": [{"name": "count"}]},
+        {**_schema_dict(), "parameters": 5},
+        ["not", "a", "mapping"],
+        None,
+    ],
+    ids=[
+        "missing-parameters",
+        "unknown-field",
+        "bad-parameter",
+        "non-iterable-parameters",
+        "sequence",
+        "none",
+    ],
+)
+def test_from_dict_rejects_invalid_data(validation, data):
+    """Test that malformed schema data raises ValidationError."""
+    with pytest.raises(ValidationError, match="Invalid"):
+        validation.ToolSchema.from_dict(data)
+
+
+def test_latest_version_is_ordered_numerically(validation):
+    """Test that 1.10.0 is latest even when registered before 1.9.0."""
+    for version in ("1.10.0", "1.9.0", "1.2.0"):
+        validation.register_tool_schema(
+            validation.ToolSchema.from_dict(_schema_dict(version))
+        )
+
+    assert validation.get_tool_schema("repeat").version == "1.10.0"
+    assert validation.list_tool_schemas() == {"repeat": ["1.10.0", "1.9.0", "1.2.0"]}
+
+
+def test_get_compiled_tool_schema(validation):
+    """Test that the compiled JSON Schema is built once and shared."""
+    validation.register_tool_schema(validation.ToolSchema.from_dict(_schema_dict()))
+
+    compiled = validation.get_compiled_tool_schema("repeat")
+
+    assert compiled is validation.get_compiled_tool_schema("repeat", "1.0.0")
+    assert compiled["properties"]["count"] == {
+        "type": "integer",
+        "description": "Times to repeat",
+        "minimum": 1.0,
+        "maximum": 10.0,
+    }
+    with pytest.raises(ValidationError, match=r"version 2\.0\.0"):
+        validation.get_compiled_tool_schema("repeat", "2.0.0")
+    with pytest.raises(ValidationError, match="No schema registered for tool echo"):
+        validation.get_compiled_tool_schema("echo")
+
+
+def test_cached_validator_reports_parameter_errors(validation):
+    """Test that a reused validator still reports invalid parameters."""
+    validation.register_tool_schema(validation.ToolSchema.from_dict(_schema_dict()))
+
+    validation.validate_tool_parameters("repeat", {"count": 3})
+    with pytest.raises(ValidationError, match="Parameter validation failed") as exc:
+        validation.validate_tool_parameters("repeat", {"count": 11})
+
+    assert exc.value.details["path"] == ["count"]
+    assert exc.value.details["validator"] == "maximum"
+    assert len(validation.validators._compiled_validators) == 1
+
+
+def test_unknown_tool_skips_parameter_validation(validation):
+    """Test that tools without a schema are not validated."""
+    validation.validate_tool_parameters("unknown", {"anything": object()})
@@ -0,0 +1,74 @@
+"""Unit tests for the VersionManager."""
+
+import pytest
+
+from chemist_server.mcp_core.adapters.version import (
+    VersionInfo,
+    VersionManager,
+    VersionStrategy,
+)
+from chemist_server.mcp_core.errors import AdapterError
+
+# --- Helpers ---
+
+
+def _info(version: str, **kwargs) -> VersionInfo:
+    return VersionInfo(version=version, released_at="2024-01-01", **kwargs)
+
+
+# --- Test Cases ---
+
+
+def test_latest_semantic_version_uses_numeric_order():
+    """Test that semantic versions compare numerically, not lexically."""
+    manager = VersionManager()
+    for version in ("1.2.0", "1.10.0", "1.9.3"):
+        manager.register_version("tool", _info(version))
+
+    assert manager.get_latest_version("tool") == "1.10.0"
+
+
+def test_latest_increment_version():
+    """Test that increment versions compare as integers."""
+    manager = VersionManager(VersionStrategy.INCREMENT)
+    for version in ("9", "10", "2"):
+        manager.register_version("tool", _info(version))
+
+    assert manager.get_latest_version("tool") == "10"
+
+
+def test_explicit_latest_overrides_highest():
+    """Test that a version marked is_latest wins and unmarks the previous one."""
+    manager = VersionManager()
+    manager.register_version("tool", _info("1.0.0", is_latest=True))
+    manager.register_version("tool", _info("2.0.0"))
+    assert manager.get_latest_version("tool") == "1.0.0"
+
+    manager.register_version("tool", _info("1.5.0", is_latest=True))
+    assert manager.get_latest_version("tool") == "1.5.0"
+    assert manager.get_version_info("tool", "1.0.0").is_latest is False
+
+
+def test_no_versions_raises():
+    """Test that asking for an unknown tool raises AdapterError."""
+    manager = VersionManager()
+
+    with pytest.raises(AdapterError, match="No versions registered"):
+        manager.get_latest_version("missing")
+
+
+@pytest.mark.parametrize(
+    ("strategy", "version"),
+    [
+        (VersionStrategy.SEMANTIC, "1.2"),
+        (VersionStrategy.SEMANTIC, "1.2.x"),
+        (VersionStrategy.DATE, "2024011"),
+        (VersionStrategy.INCREMENT, "1.0"),
+    ],
+)
+def test_invalid_versions_rejected(strategy: VersionStrategy, version: str):
+    """Test that versions not matching the strategy format are rejected."""
+    manager = VersionManager(strategy)
+
+    with pytest.raises(AdapterError, match="Invalid"):
+        manager.register_version("tool", _info(version))